@@ -1,6 +1,9 @@
 """Generate the API reference pages automatically."""
 
+from itertools import groupby
 from pathlib import Path
+import hashlib
+import json
 import re
 
 import mkdocs_gen_files
@@ -8,6 +11,13 @@ import mkdocs_gen_files
 # Objects to document from the kaspa module
 stub_file = Path("kaspa.pyi")
 
+# Parsed stub objects are cached here, keyed by a hash of the stub contents,
+# so rebuilds (e.g. `mkdocs serve`) skip parsing an unchanged stub
+manifest_file = Path(".cache", "api_manifest.json")
+
+# Bump when parse_stub_file output changes to invalidate existing manifests
+MANIFEST_VERSION = 1
+
 nav = mkdocs_gen_files.Nav()
 
 CATEGORY_ORDER = [
@@ -17,26 +27,65 @@ CATEGORY_ORDER = [
     "TypedDicts",
 ]
 
+# Display label for each object type
+_TYPE_LABELS = {
+    "enum": "Enum",
+    "typeddict": "TypedDict",
+    "class": "Class",
+    "function": "Func",
+}
+
+# Contents of each generated object reference page
+_PAGE_TMPL = (
+    "# `{name}` ({label})\n\n"
+    "::: kaspa.{name}\n"
+    "    options:\n"
+    "      show_root_heading: false\n"
+    "      show_root_full_path: false\n"
+)
+
+# Literal prefixes of top-level declaration lines, used to skip every other
+# line of the stub before any regex work is done
+_DECL_PREFIXES = ("class ", "def ")
+
+# Pattern to parse a single top-level class or function declaration line
+# Matches: class Name: or class Name(bases):
+#      or: def name(...):
+_DECL_RE = re.compile(
+    r'(?:class\s+(\w+)(?:\(([^)]*)\))?:[ \t]*|def\s+(\w+)[^\n]+:)$'
+)
+
+# Pattern to match "Category: Something" or "Category: Something/Subcategory"
+_CATEGORY_RE = re.compile(r'Category:\s*([^\n]+)', re.IGNORECASE)
+
 
 def parse_stub_file(content: str) -> dict:
     """
     Parse the .pyi stub file and extract objects with their categories.
 
     Returns dict mapping object names to their info:
-        {name: {"type": "class"|"function"|"enum"|"typeddict", "category": str}}
+        {name: {"type": "class"|"function"|"enum"|"typeddict", "category": str,
+                "label": str}}
     """
     objects = {}
 
-    # Pattern to match class definitions with their docstrings
-    # Matches: class Name: or class Name(bases):
-    # followed by optional docstring
-    class_pattern = re.compile(
-        r'^(?:@typing\.final\s*\n)?class\s+(\w+)(?:\(([^)]*)\))?:\s*\n'
-        r'(?:\s+r?"""(.*?)""")?',
-        re.MULTILINE | re.DOTALL
-    )
+    for line in content.splitlines():
+        if not line.startswith(_DECL_PREFIXES):
+            continue
+
+        match = _DECL_RE.match(line)
+        if not match:
+            continue
+
+        func_name = match.group(3)
+        if func_name:
+            objects[func_name] = {
+                "type": "function",
+                "category": "Functions",
+                "label": _TYPE_LABELS["function"],
+            }
+            continue
 
-    for match in class_pattern.finditer(content):
         name = match.group(1)
         bases = match.group(2) or ""
 
@@ -51,17 +100,39 @@ def parse_stub_file(content: str) -> dict:
             obj_type = "class"
             category = "Classes"
 
-        objects[name] = {"type": obj_type, "category": category}
+        objects[name] = {
+            "type": obj_type,
+            "category": category,
+            "label": _TYPE_LABELS[obj_type],
+        }
 
-    # Find standalone functions with their docstrings
-    # Pattern: def name(...): on single line, followed by optional docstring
-    func_pattern = re.compile(
-        r'^def\s+(\w+)[^\n]+:\n(?:\s+r?"""(.*?)""")?',
-        re.MULTILINE | re.DOTALL
-    )
-    for match in func_pattern.finditer(content):
-        name = match.group(1)
-        objects[name] = {"type": "function", "category": "Functions"}
+    return objects
+
+
+def load_objects(stub_bytes: bytes) -> dict:
+    """
+    Load the parsed stub objects from the manifest cache.
+
+    Falls back to parsing the stub (and rewriting the manifest) when the
+    manifest is missing, unreadable, or was built from a different stub.
+    """
+    key = f"{MANIFEST_VERSION}:{hashlib.blake2b(stub_bytes, digest_size=16).hexdigest()}"
+
+    try:
+        manifest = json.loads(manifest_file.read_bytes())
+        if manifest["key"] == key:
+            return manifest["objects"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    objects = parse_stub_file(stub_bytes.decode("utf-8"))
+
+    # The manifest is only a cache; skip it if it cannot be written
+    try:
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        manifest_file.write_text(json.dumps({"key": key, "objects": objects}))
+    except OSError:
+        pass
 
     return objects
 
@@ -71,8 +142,7 @@ def extract_category(docstring: str, default: str) -> str:
     if not docstring:
         return default
 
-    # Look for "Category: Something" or "Category: Something/Subcategory"
-    match = re.search(r'Category:\s*([^\n]+)', docstring, re.IGNORECASE)
+    match = _CATEGORY_RE.search(docstring)
     if match:
         return match.group(1).strip()
 
@@ -88,27 +158,17 @@ def category_sort_key(category: str) -> tuple:
 
 
 if stub_file.exists():
-    content = stub_file.read_text()
-    objects = parse_stub_file(content)
-
-    # Group objects by category
-    by_category: dict[str, list[str]] = {}
-    for name, info in objects.items():
-        cat = info["category"]
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(name)
-
-    # Sort objects within each category
-    for cat in by_category:
-        by_category[cat].sort()
+    objects = load_objects(stub_file.read_bytes())
 
-    # Sort categories
-    sorted_categories = sorted(by_category.keys(), key=category_sort_key)
+    # Sort objects by category, then by name within each category, so a
+    # single groupby pass yields every category in order
+    sorted_objects = sorted(
+        objects.items(),
+        key=lambda item: (category_sort_key(item[1]["category"]), item[0]),
+    )
 
     # Generate index page
-    index_path = Path("reference", "index.md")
-    with mkdocs_gen_files.open(index_path, "w") as f:
+    with mkdocs_gen_files.open("reference/index.md", "w") as f:
         f.write((
             "# API Reference\n\n"
             "Complete reference for the Kaspa Python SDK."
@@ -116,44 +176,33 @@ if stub_file.exists():
 
     nav[("index",)] = "index.md"
 
-    def get_type_label(name: str) -> str:
-        """Get the display label for an object's type."""
-        obj_type = objects[name]["type"]
-        if obj_type == "enum":
-            return "Enum"
-        elif obj_type == "typeddict":
-            return "TypedDict"
-        elif obj_type == "class":
-            return "Class"
-        else:
-            return "Func"
-
-    def nav_label(name: str) -> str:
-        """Generate navigation label."""
-        return f'{name}'
-
     def category_to_nav_path(category: str) -> tuple:
         """Convert category string to nav path tuple."""
         return tuple(category.split("/"))
 
-    # Generate category index pages and item pages
-    for category in sorted_categories:
+    # Build the content of every item page first, as (path, content) pairs
+    pages = []
+    for category, group in groupby(
+        sorted_objects, key=lambda item: item[1]["category"]
+    ):
         nav_path = category_to_nav_path(category)
+        parent = f"reference/{category}"
 
         # Generate pages for each item in category subdirectory
-        for name in by_category[category]:
-            doc_path = Path("reference", category, f"{name}.md")
-            type_label = get_type_label(name)
-
-            with mkdocs_gen_files.open(doc_path, "w") as f:
-                f.write(f'# `{name}` ({type_label})\n\n')
-                f.write(f"::: kaspa.{name}\n")
-                f.write("    options:\n")
-                f.write("      show_root_heading: false\n")
-                f.write("      show_root_full_path: false\n")
+        for name, info in group:
+            pages.append((
+                f"{parent}/{name}.md",
+                _PAGE_TMPL.format(name=name, label=info["label"]),
+            ))
 
             # Add to nav with category hierarchy
-            nav[(*nav_path, nav_label(name))] = f"{category}/{name}.md"
+            nav[(*nav_path, name)] = f"{category}/{name}.md"
+
+    # Then write them out in a single sequential pass; mkdocs_gen_files does
+    # not document its virtual files as thread-safe, so writes are not parallel
+    for doc_path, page in pages:
+        with mkdocs_gen_files.open(doc_path, "w") as f:
+            f.write(page)
 
     # Generate the navigation file
     with mkdocs_gen_files.open("reference/SUMMARY.md", "w") as nav_file:
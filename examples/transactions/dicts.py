@@ -4,9 +4,13 @@ Examples demonstrating to_dict/from_dict conversion for consensus client types.
 Each function shows:
 1. Creating an object from a dictionary using from_dict()
 2. Converting it back to a dictionary using to_dict()
-3. Verifying the round-trip produces equal objects
+3. Verifying the round-trip produces equal objects using verify_roundtrip()
 """
 
+import contextlib
+import io
+import sys
+
 from kaspa import (
     Transaction,
     TransactionInput,
@@ -16,6 +20,13 @@ from kaspa import (
     UtxoEntryReference,
 )
 
+# Values shared by the examples below, built once at import
+TRANSACTION_ID = "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75"
+OUTPUT_SCRIPT = "2079b0fb70f7b5be66f6b448d765f6385132a599c3c516f60dd6069d1d5f29d217ac"
+UTXO_SCRIPT = "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac"
+UTXO_ADDRESS = "kaspatest:qzy5xn4ue047muj3sz7g7a2gk5k5achh22kyhg64k7rj4afw8lp5kurchfh2n"
+SUBNETWORK_ID_NATIVE = "0000000000000000000000000000000000000000"
+
 
 def transaction_outpoint_example():
     """TransactionOutpoint from_dict/to_dict example."""
@@ -24,7 +35,7 @@ def transaction_outpoint_example():
     print("=" * 60)
 
     input_dict = {
-        "transactionId": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+        "transactionId": TRANSACTION_ID,
         "index": 5,
     }
     print("INPUT DICT:", input_dict)
@@ -33,8 +44,7 @@ def transaction_outpoint_example():
     output_dict = outpoint.to_dict()
     print("OUTPUT DICT:", output_dict)
 
-    restored = TransactionOutpoint.from_dict(output_dict)
-    print("ROUND-TRIP EQUAL:", outpoint == restored)
+    print("ROUND-TRIP EQUAL:", TransactionOutpoint.verify_roundtrip(input_dict))
     print()
 
 
@@ -48,7 +58,7 @@ def transaction_output_example():
         "value": 1000000,
         "scriptPublicKey": {
             "version": 0,
-            "script": "2079b0fb70f7b5be66f6b448d765f6385132a599c3c516f60dd6069d1d5f29d217ac",
+            "script": OUTPUT_SCRIPT,
         },
     }
     print("INPUT DICT:", input_dict)
@@ -57,8 +67,7 @@ def transaction_output_example():
     output_dict = output.to_dict()
     print("OUTPUT DICT:", output_dict)
 
-    restored = TransactionOutput.from_dict(output_dict)
-    print("ROUND-TRIP EQUAL:", output == restored)
+    print("ROUND-TRIP EQUAL:", TransactionOutput.verify_roundtrip(input_dict))
     print()
 
 
@@ -70,7 +79,7 @@ def transaction_input_example():
 
     input_dict = {
         "previousOutpoint": {
-            "transactionId": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+            "transactionId": TRANSACTION_ID,
             "index": 0,
         },
         "signatureScript": "deadbeef",
@@ -84,8 +93,12 @@ def transaction_input_example():
     output_dict = tx_input.to_dict()
     print("OUTPUT DICT:", output_dict)
 
-    restored = TransactionInput.from_dict(output_dict)
-    print("ROUND-TRIP EQUAL:", tx_input == restored)
+    print("ROUND-TRIP EQUAL:", TransactionInput.verify_roundtrip(input_dict))
+
+    # JSON is parsed directly in Rust, without building a Python dict first
+    input_json = tx_input.to_json()
+    print("JSON:", input_json)
+    print("FROM JSON EQUAL:", TransactionInput.from_json(input_json) == tx_input)
     print()
 
 
@@ -96,12 +109,12 @@ def transaction_example():
     print("=" * 60)
 
     input_dict = {
-        "id": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+        "id": TRANSACTION_ID,
         "version": 0,
         "inputs": [
             {
                 "previousOutpoint": {
-                    "transactionId": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+                    "transactionId": TRANSACTION_ID,
                     "index": 0,
                 },
                 "signatureScript": "",
@@ -115,12 +128,12 @@ def transaction_example():
                 "value": 500000,
                 "scriptPublicKey": {
                     "version": 0,
-                    "script": "2079b0fb70f7b5be66f6b448d765f6385132a599c3c516f60dd6069d1d5f29d217ac",
+                    "script": OUTPUT_SCRIPT,
                 },
             }
         ],
         "lockTime": 0,
-        "subnetworkId": "0" * 40,
+        "subnetworkId": SUBNETWORK_ID_NATIVE,
         "gas": 0,
         "payload": "",
         "mass": 0,
@@ -131,8 +144,12 @@ def transaction_example():
     output_dict = tx.to_dict()
     print("OUTPUT DICT:", output_dict)
 
-    restored = Transaction.from_dict(output_dict)
-    print("ROUND-TRIP EQUAL:", tx == restored)
+    print("ROUND-TRIP EQUAL:", Transaction.verify_roundtrip(input_dict))
+
+    # JSON bytes (e.g. read from a file or socket) are parsed without decoding to str
+    tx_json = tx.to_json_bytes()
+    print("JSON BYTES:", tx_json)
+    print("FROM JSON BYTES EQUAL:", Transaction.from_json_bytes(tx_json) == tx)
     print()
 
 
@@ -143,15 +160,15 @@ def utxo_entry_example():
     print("=" * 60)
 
     input_dict = {
-        "address": "kaspatest:qzy5xn4ue047muj3sz7g7a2gk5k5achh22kyhg64k7rj4afw8lp5kurchfh2n",
+        "address": UTXO_ADDRESS,
         "outpoint": {
-            "transactionId": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+            "transactionId": TRANSACTION_ID,
             "index": 0,
         },
         "amount": 1000000,
         "scriptPublicKey": {
             "version": 0,
-            "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac",
+            "script": UTXO_SCRIPT,
         },
         "blockDaaScore": 12345,
         "isCoinbase": False,
@@ -162,8 +179,7 @@ def utxo_entry_example():
     output_dict = entry.to_dict()
     print("OUTPUT DICT:", output_dict)
 
-    restored = UtxoEntry.from_dict(output_dict)
-    print("ROUND-TRIP EQUAL:", entry == restored)
+    print("ROUND-TRIP EQUAL:", UtxoEntry.verify_roundtrip(input_dict))
     print()
 
 
@@ -175,15 +191,15 @@ def utxo_entry_reference_example():
 
     # Flat format (same as UtxoEntry)
     input_dict = {
-        "address": "kaspatest:qzy5xn4ue047muj3sz7g7a2gk5k5achh22kyhg64k7rj4afw8lp5kurchfh2n",
+        "address": UTXO_ADDRESS,
         "outpoint": {
-            "transactionId": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+            "transactionId": TRANSACTION_ID,
             "index": 2,
         },
         "amount": 2500000,
         "scriptPublicKey": {
             "version": 0,
-            "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac",
+            "script": UTXO_SCRIPT,
         },
         "blockDaaScore": 67890,
         "isCoinbase": False,
@@ -194,8 +210,7 @@ def utxo_entry_reference_example():
     output_dict = entry_ref.to_dict()
     print("OUTPUT DICT:", output_dict)
 
-    restored = UtxoEntryReference.from_dict(output_dict)
-    print("ROUND-TRIP EQUAL:", entry_ref == restored)
+    print("ROUND-TRIP EQUAL:", UtxoEntryReference.verify_roundtrip(input_dict))
     print()
 
     # Also demonstrate nested format support (compatible with utxos returned via RPC)
@@ -204,16 +219,16 @@ def utxo_entry_reference_example():
     print("=" * 60)
 
     nested_dict = {
-        "address": "kaspatest:qzy5xn4ue047muj3sz7g7a2gk5k5achh22kyhg64k7rj4afw8lp5kurchfh2n",
+        "address": UTXO_ADDRESS,
         "outpoint": {
-            "transactionId": "368caa222bd878b987bf75d07f0bc6a6dbb866be754c421a73e33edd59552b75",
+            "transactionId": TRANSACTION_ID,
             "index": 2,
         },
         "utxoEntry": {
             "amount": 2500000,
             "scriptPublicKey": {
                 "version": 0,
-                "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac",
+                "script": UTXO_SCRIPT,
             },
             "blockDaaScore": 67890,
             "isCoinbase": False,
@@ -226,11 +241,30 @@ def utxo_entry_reference_example():
     print("Both formats produce equal objects:", entry_ref == entry_ref_nested)
     print()
 
+    # Lists of dicts (e.g. `entries` returned by `get_utxos_by_addresses`) can be
+    # converted in a single call
+    print("=" * 60)
+    print("UtxoEntryReference (list of dicts)")
+    print("=" * 60)
+
+    entry_refs = UtxoEntryReference.from_dict_many([input_dict, nested_dict])
+    print("OUTPUT DICTS:", UtxoEntryReference.to_dict_many(entry_refs))
+    print("Items equal to single conversions:", entry_refs == [entry_ref, entry_ref_nested])
+    print()
+
 
 if __name__ == "__main__":
-    transaction_outpoint_example()
-    transaction_output_example()
-    transaction_input_example()
-    transaction_example()
-    utxo_entry_example()
-    utxo_entry_reference_example()
+    # Collect all output in memory and write it to stdout once
+    # (written out even if an example raises, so earlier output is kept)
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            transaction_outpoint_example()
+            transaction_output_example()
+            transaction_input_example()
+            transaction_example()
+            utxo_entry_example()
+            utxo_entry_reference_example()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
@@ -21,9 +21,11 @@ async def main():
     entries = await client.get_utxos_by_addresses({"addresses": [source_address]})
     entries = entries["entries"]
 
-    entries = sorted(
-        entries, key=lambda x: x['utxoEntry']['amount'], reverse=True)
-    total = sum(item['utxoEntry']['amount'] for item in entries)
+    # Extract amounts once, then sort indices by them (largest first)
+    amounts = [entry['utxoEntry']['amount'] for entry in entries]
+    order = sorted(range(len(entries)), key=amounts.__getitem__, reverse=True)
+    entries = [entries[i] for i in order]
+    total = sum(amounts)
 
     generator = Generator(
         network_id="testnet-10",
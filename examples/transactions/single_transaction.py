@@ -25,8 +25,11 @@ async def main():
     utxos = await client.get_utxos_by_addresses({"addresses": [address]})
     utxos = utxos["entries"]
 
-    utxos = sorted(utxos, key=lambda x: x['utxoEntry']['amount'], reverse=True)
-    total = sum(item['utxoEntry']['amount'] for item in utxos)
+    # Extract amounts once, then sort indices by them (largest first)
+    amounts = [utxo['utxoEntry']['amount'] for utxo in utxos]
+    order = sorted(range(len(utxos)), key=amounts.__getitem__, reverse=True)
+    utxos = [utxos[i] for i in order]
+    total = sum(amounts)
 
     # Placeholder tx, used to get mass
     outputs = [
@@ -22,12 +22,17 @@ async def main():
     context = UtxoContext(processor)
     await context.track_addresses([TEST_ADDRESS])
 
-    mature_length = context.mature_length
+    # Independent reads can be awaited concurrently
+    mature_length, balance, balance_strings = await asyncio.gather(
+        context.get_mature_length(),
+        context.get_balance(),
+        context.get_balance_strings(),
+    )
     end = min(5, mature_length)
     print(f"Mature length: {mature_length}")
     print(f"Mature range (0..{end}): {context.mature_range(from_=0, to=end)}")
-    print(f"Balance: {context.balance}")
-    print(f"Balance strings: {context.balance_strings}")
+    print(f"Balance: {balance}")
+    print(f"Balance strings: {balance_strings}")
 
     await processor.stop()
     await client.disconnect()
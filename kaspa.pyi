@@ -425,6 +425,17 @@ class Hash:
         Raises:
             Exception: If the hex string is invalid.
         """
+    @staticmethod
+    def zero() -> Hash:
+        r"""
+        The all-zero hash.
+        
+        The instance is created once and shared between calls, as Hash is
+        immutable.
+        
+        Returns:
+            Hash: A Hash of 32 zero bytes.
+        """
     def to_string(self) -> builtins.str:
         r"""
         Convert the hash to a hex string.
@@ -1925,6 +1936,10 @@ class Transaction:
         r"""
         The transaction ID (hash).
         
+        The ID is computed once, when the transaction is created or
+        `finalize()` is called, and stored; reading it does not rehash the
+        transaction. Call `finalize()` after modifying fields to refresh it.
+        
         Returns:
             str: The transaction ID as a hex string.
         """
@@ -2112,6 +2127,17 @@ class Transaction:
         Returns:
             dict: the Transaction in dictionary form.
         """
+    def to_tuple(self) -> tuple:
+        r"""
+        Get a tuple representation of the Transaction.
+        
+        Holds the same values as `to_dict()` in key order, for callers that
+        re-serialize fields positionally and do not need key lookup.
+        
+        Returns:
+            tuple: (id, version, inputs, outputs, lockTime, subnetworkId, gas, payload, mass),
+                with inputs and outputs in dictionary form.
+        """
     @classmethod
     def from_dict(cls, dict: dict) -> Transaction:
         r"""
@@ -2132,6 +2158,113 @@ class Transaction:
         Returns:
             Transaction: A new Transaction instance.
         
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @classmethod
+    def from_dict_many(cls, dicts: list[dict]) -> builtins.list[Transaction]:
+        r"""
+        Create a list of Transactions from a list of dictionaries.
+        
+        Equivalent to calling `from_dict()` on each item, but the list is
+        walked in a single call.
+        
+        Args:
+            dicts: List of dictionaries, each in the format accepted by `from_dict()`.
+        
+        Returns:
+            list[Transaction]: The Transaction instances, in input order.
+        
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @staticmethod
+    def to_dict_many(transactions: list[Transaction]) -> builtins.list[dict]:
+        r"""
+        Get dictionary representations of a list of Transactions.
+        
+        Equivalent to calling `to_dict()` on each item, but the list is
+        walked in a single call.
+        
+        Args:
+            transactions: List of Transaction instances.
+        
+        Returns:
+            list[dict]: The Transactions in dictionary form, in input order.
+        """
+    def to_json(self) -> builtins.str:
+        r"""
+        Get a JSON representation of the Transaction.
+        
+        Returns:
+            str: the Transaction as a JSON string.
+        
+        Raises:
+            ValueError: If serialization fails.
+        """
+    @classmethod
+    def from_json(cls, json: builtins.str) -> Transaction:
+        r"""
+        Create a Transaction from a JSON string.
+        
+        The JSON is parsed directly in Rust without building intermediate
+        Python objects. Only the format produced by `to_json()` is accepted;
+        the `to_dict()` layout (as returned by RPC calls) is not, use
+        `from_dict()` for that.
+        
+        Args:
+            json: JSON string in the format produced by `to_json()`.
+        
+        Returns:
+            Transaction: A new Transaction instance.
+        
+        Raises:
+            ValueError: If the JSON is invalid.
+        """
+    def to_json_bytes(self) -> builtins.bytes:
+        r"""
+        Get a UTF-8 encoded JSON representation of the Transaction.
+        
+        Returns:
+            bytes: the Transaction as UTF-8 encoded JSON.
+        
+        Raises:
+            ValueError: If serialization fails.
+        """
+    @classmethod
+    def from_json_bytes(cls, data: builtins.bytes) -> Transaction:
+        r"""
+        Create a Transaction from UTF-8 encoded JSON.
+        
+        Accepts JSON as read from a file or socket without decoding it to
+        a `str` first. Only the format produced by `to_json_bytes()` is
+        accepted; the `to_dict()` layout is not, use `from_dict()` for that.
+        
+        Args:
+            data: UTF-8 encoded JSON in the format produced by `to_json_bytes()`.
+        
+        Returns:
+            Transaction: A new Transaction instance.
+        
+        Raises:
+            ValueError: If the JSON is invalid.
+        """
+    @classmethod
+    def verify_roundtrip(cls, dict: dict) -> builtins.bool:
+        r"""
+        Check that a dictionary survives a from_dict/to_dict round-trip.
+        
+        Creates a Transaction from `dict`, converts it back to a dictionary and
+        creates a second Transaction from that, all within a single call.
+        
+        Args:
+            dict: Dictionary in the format accepted by `from_dict()`.
+        
+        Returns:
+            bool: True if both Transaction instances are equal.
+        
         Raises:
             KeyError: If required keys are missing.
             ValueError: If values are invalid.
@@ -2259,6 +2392,84 @@ class TransactionInput:
             KeyError: If required keys are missing.
             ValueError: If values are invalid.
         """
+    def to_json(self) -> builtins.str:
+        r"""
+        Get a JSON representation of the TransactionInput.
+        
+        Returns:
+            str: the TransactionInput as a JSON string.
+        
+        Raises:
+            ValueError: If serialization fails.
+        """
+    @classmethod
+    def from_json(cls, json: builtins.str) -> TransactionInput:
+        r"""
+        Create a TransactionInput from a JSON string.
+        
+        The JSON is parsed directly in Rust without building intermediate
+        Python objects. Only the format produced by `to_json()` is accepted;
+        the `to_dict()` layout is not, use `from_dict()` for that.
+        
+        Args:
+            json: JSON string in the format produced by `to_json()`.
+        
+        Returns:
+            TransactionInput: A new TransactionInput instance.
+        
+        Raises:
+            ValueError: If the JSON is invalid.
+        """
+    @classmethod
+    def verify_roundtrip(cls, dict: dict) -> builtins.bool:
+        r"""
+        Check that a dictionary survives a from_dict/to_dict round-trip.
+        
+        Creates a TransactionInput from `dict`, converts it back to a dictionary and
+        creates a second TransactionInput from that, all within a single call.
+        
+        Args:
+            dict: Dictionary in the format accepted by `from_dict()`.
+        
+        Returns:
+            bool: True if both TransactionInput instances are equal.
+        
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @classmethod
+    def from_dict_many(cls, dicts: list[dict]) -> builtins.list[TransactionInput]:
+        r"""
+        Create a list of TransactionInputs from a list of dictionaries.
+        
+        Equivalent to calling `from_dict()` on each item, but the list is
+        walked in a single call.
+        
+        Args:
+            dicts: List of dictionaries, each in the format accepted by `from_dict()`.
+        
+        Returns:
+            list[TransactionInput]: The TransactionInput instances, in input order.
+        
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @staticmethod
+    def to_dict_many(inputs: list[TransactionInput]) -> builtins.list[dict]:
+        r"""
+        Get dictionary representations of a list of TransactionInputs.
+        
+        Equivalent to calling `to_dict()` on each item, but the list is
+        walked in a single call.
+        
+        Args:
+            inputs: List of TransactionInput instances.
+        
+        Returns:
+            list[dict]: The TransactionInputs in dictionary form, in input order.
+        """
     def __eq__(self, other: TransactionInput) -> builtins.bool: ...
 
 @typing.final
@@ -2284,16 +2495,20 @@ class TransactionOutpoint:
         Returns:
             int: The output index.
         """
-    def __new__(cls, transaction_id: Hash, index: builtins.int) -> TransactionOutpoint:
+    def __new__(cls, transaction_id: Hash | str | bytes, index: builtins.int) -> TransactionOutpoint:
         r"""
         Create a new transaction outpoint.
         
         Args:
-            transaction_id: The ID of the transaction containing the output.
+            transaction_id: The ID of the transaction containing the output, as a
+                Hash, a 64-character hex string, or 32 bytes.
             index: The index of the output within the transaction.
         
         Returns:
             TransactionOutpoint: A new TransactionOutpoint instance.
+        
+        Raises:
+            ValueError: If the transaction ID string or bytes are invalid.
         """
     def get_id(self) -> builtins.str:
         r"""
@@ -2323,6 +2538,24 @@ class TransactionOutpoint:
         Returns:
             TransactionOutpoint: A new TransactionOutpoint instance.
         
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @classmethod
+    def verify_roundtrip(cls, dict: dict) -> builtins.bool:
+        r"""
+        Check that a dictionary survives a from_dict/to_dict round-trip.
+        
+        Creates a TransactionOutpoint from `dict`, converts it back to a dictionary and
+        creates a second TransactionOutpoint from that, all within a single call.
+        
+        Args:
+            dict: Dictionary in the format accepted by `from_dict()`.
+        
+        Returns:
+            bool: True if both TransactionOutpoint instances are equal.
+        
         Raises:
             KeyError: If required keys are missing.
             ValueError: If values are invalid.
@@ -2401,6 +2634,24 @@ class TransactionOutput:
         Returns:
             TransactionOutput: A new TransactionOutput instance.
         
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @classmethod
+    def verify_roundtrip(cls, dict: dict) -> builtins.bool:
+        r"""
+        Check that a dictionary survives a from_dict/to_dict round-trip.
+        
+        Creates a TransactionOutput from `dict`, converts it back to a dictionary and
+        creates a second TransactionOutput from that, all within a single call.
+        
+        Args:
+            dict: Dictionary in the format accepted by `from_dict()`.
+        
+        Returns:
+            bool: True if both TransactionOutput instances are equal.
+        
         Raises:
             KeyError: If required keys are missing.
             ValueError: If values are invalid.
@@ -2460,6 +2711,27 @@ class UtxoContext:
         r"""
         Return a range of mature UTXO entries.
         """
+    def get_mature_length(self) -> typing.Any:
+        r"""
+        Number of mature UTXO entries (async).
+        
+        Async counterpart of `mature_length`. The same synchronous read runs inside the
+        returned future on the async runtime, not on a separate blocking thread.
+        """
+    def get_balance(self) -> typing.Any:
+        r"""
+        Current balance for this context, if available (async).
+        
+        Async counterpart of `balance`. The same synchronous read runs inside the
+        returned future on the async runtime, not on a separate blocking thread.
+        """
+    def get_balance_strings(self) -> typing.Any:
+        r"""
+        Current balance formatted as strings, if available (async).
+        
+        Async counterpart of `balance_strings`. The same synchronous read runs inside the
+        returned future on the async runtime, not on a separate blocking thread.
+        """
 
 @typing.final
 class UtxoEntries:
@@ -2601,6 +2873,24 @@ class UtxoEntry:
         Returns:
             UtxoEntry: A new UtxoEntry instance.
         
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @classmethod
+    def verify_roundtrip(cls, dict: dict) -> builtins.bool:
+        r"""
+        Check that a dictionary survives a from_dict/to_dict round-trip.
+        
+        Creates a UtxoEntry from `dict`, converts it back to a dictionary and
+        creates a second UtxoEntry from that, all within a single call.
+        
+        Args:
+            dict: Dictionary in the format accepted by `from_dict()`.
+        
+        Returns:
+            bool: True if both UtxoEntry instances are equal.
+        
         Raises:
             KeyError: If required keys are missing.
             ValueError: If values are invalid.
@@ -2706,6 +2996,59 @@ class UtxoEntryReference:
             KeyError: If required keys are missing.
             ValueError: If values are invalid.
         """
+    @classmethod
+    def verify_roundtrip(cls, dict: dict) -> builtins.bool:
+        r"""
+        Check that a dictionary survives a from_dict/to_dict round-trip.
+        
+        Creates a UtxoEntryReference from `dict`, converts it back to a dictionary and
+        creates a second UtxoEntryReference from that, all within a single call.
+        
+        Args:
+            dict: Dictionary in the format accepted by `from_dict()`.
+        
+        Returns:
+            bool: True if every entry field (address, outpoint, amount, script public key,
+                block DAA score, coinbase flag) of both instances matches. This is stricter
+                than `==`.
+        
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @classmethod
+    def from_dict_many(cls, dicts: list[dict]) -> builtins.list[UtxoEntryReference]:
+        r"""
+        Create a list of UtxoEntryReferences from a list of dictionaries.
+        
+        Equivalent to calling `from_dict()` on each item, but the list is
+        walked in a single call. Accepts the `entries` list returned by
+        `RpcClient.get_utxos_by_addresses()` as is.
+        
+        Args:
+            dicts: List of dictionaries, each in a format accepted by `from_dict()`.
+        
+        Returns:
+            list[UtxoEntryReference]: The UtxoEntryReference instances, in input order.
+        
+        Raises:
+            KeyError: If required keys are missing.
+            ValueError: If values are invalid.
+        """
+    @staticmethod
+    def to_dict_many(entries: list[UtxoEntryReference]) -> builtins.list[dict]:
+        r"""
+        Get dictionary representations of a list of UtxoEntryReferences.
+        
+        Equivalent to calling `to_dict()` on each item, but the list is
+        walked in a single call.
+        
+        Args:
+            entries: List of UtxoEntryReference instances.
+        
+        Returns:
+            list[dict]: The UtxoEntryReferences in dictionary form, in input order.
+        """
 
 @typing.final
 class UtxoProcessor:
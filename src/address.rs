@@ -190,3 +190,13 @@ impl TryFrom<String> for PyAddress {
         Ok(PyAddress(inner))
     }
 }
+
+impl TryFrom<&str> for PyAddress {
+    type Error = PyErr;
+
+    fn try_from(value: &str) -> Result<Self, Self::Error> {
+        let inner =
+            Address::try_from(value).map_err(|err| PyException::new_err(err.to_string()))?;
+        Ok(PyAddress(inner))
+    }
+}
@@ -1,13 +1,14 @@
 use crate::{
     consensus::client::{outpoint::PyTransactionOutpoint, utxo::PyUtxoEntryReference},
     consensus::convert::TryToPyDict,
-    types::PyBinary,
+    types::{PyBinary, decode_hex},
 };
 use kaspa_consensus_client::{TransactionInput, UtxoEntryReference};
 use pyo3::{
-    exceptions::PyKeyError,
+    exceptions::{PyKeyError, PyValueError},
+    intern,
     prelude::*,
-    types::{PyDict, PyType},
+    types::{PyDict, PyList, PyString, PyType},
 };
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 use workflow_core::hex::ToHex;
@@ -170,6 +171,108 @@ impl PyTransactionInput {
         Self::try_from(dict)
     }
 
+    /// Get a JSON representation of the TransactionInput.
+    ///
+    /// Returns:
+    ///     str: the TransactionInput as a JSON string.
+    ///
+    /// Raises:
+    ///     ValueError: If serialization fails.
+    fn to_json(&self) -> PyResult<String> {
+        serde_json::to_string(&self.0).map_err(|err| PyValueError::new_err(err.to_string()))
+    }
+
+    /// Create a TransactionInput from a JSON string.
+    ///
+    /// The JSON is parsed directly in Rust without building intermediate
+    /// Python objects. Only the format produced by `to_json()` is accepted;
+    /// the `to_dict()` layout is not, use `from_dict()` for that.
+    ///
+    /// Args:
+    ///     json: JSON string in the format produced by `to_json()`.
+    ///
+    /// Returns:
+    ///     TransactionInput: A new TransactionInput instance.
+    ///
+    /// Raises:
+    ///     ValueError: If the JSON is invalid.
+    #[classmethod]
+    fn from_json(_cls: &Bound<'_, PyType>, json: &str) -> PyResult<Self> {
+        let inner = serde_json::from_str::<TransactionInput>(json)
+            .map_err(|err| PyValueError::new_err(err.to_string()))?;
+        Ok(Self(inner))
+    }
+
+    /// Check that a dictionary survives a from_dict/to_dict round-trip.
+    ///
+    /// Creates a TransactionInput from `dict`, converts it back to a dictionary and
+    /// creates a second TransactionInput from that, all within a single call.
+    ///
+    /// Args:
+    ///     dict: Dictionary in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     bool: True if both TransactionInput instances are equal.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn verify_roundtrip(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<bool> {
+        let value = Self::try_from(dict)?;
+        let restored = Self::try_from(&value.0.try_to_pydict(dict.py())?)?;
+        Ok(value.__eq__(&restored))
+    }
+
+    /// Create a list of TransactionInputs from a list of dictionaries.
+    ///
+    /// Equivalent to calling `from_dict()` on each item, but the list is
+    /// walked in a single call.
+    ///
+    /// Args:
+    ///     dicts: List of dictionaries, each in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     list[TransactionInput]: The TransactionInput instances, in input order.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn from_dict_many(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(type_repr = "list[dict]"))] dicts: &Bound<'_, PyList>,
+    ) -> PyResult<Vec<Self>> {
+        dicts
+            .iter()
+            .map(|item| Self::try_from(item.cast::<PyDict>()?))
+            .collect()
+    }
+
+    /// Get dictionary representations of a list of TransactionInputs.
+    ///
+    /// Equivalent to calling `to_dict()` on each item, but the list is
+    /// walked in a single call.
+    ///
+    /// Args:
+    ///     inputs: List of TransactionInput instances.
+    ///
+    /// Returns:
+    ///     list[dict]: The TransactionInputs in dictionary form, in input order.
+    #[staticmethod]
+    fn to_dict_many<'py>(
+        py: Python<'py>,
+        #[gen_stub(override_type(type_repr = "list[TransactionInput]"))] inputs: &Bound<
+            'py,
+            PyList,
+        >,
+    ) -> PyResult<Vec<Bound<'py, PyDict>>> {
+        inputs
+            .iter()
+            .map(|item| item.cast::<Self>()?.borrow().0.try_to_pydict(py))
+            .collect()
+    }
+
     // Cannot be derived via pyclass(eq) as wrapped PyTransactionInput type does not derive PartialEq/Eq
     fn __eq__(&self, other: &PyTransactionInput) -> bool {
         match (bincode::serialize(&self.0), bincode::serialize(&other.0)) {
@@ -194,28 +297,22 @@ impl From<PyTransactionInput> for TransactionInput {
 impl TryFrom<&Bound<'_, PyDict>> for PyTransactionInput {
     type Error = PyErr;
     fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
+        let py = dict.py();
+
         // Parse previousOutpoint
         let previous_outpoint = PyTransactionOutpoint::try_from(
-            dict.get_item("previousOutpoint")?
+            dict.get_item(intern!(py, "previousOutpoint"))?
                 .ok_or_else(|| PyKeyError::new_err("Key `previousOutpoint` not present"))?
                 .cast::<PyDict>()?,
         )?;
 
         // Parse signatureScript (optional, can be None or empty string)
         let signature_script: Option<Vec<u8>> =
-            if let Some(sig_item) = dict.get_item("signatureScript")? {
+            if let Some(sig_item) = dict.get_item(intern!(py, "signatureScript"))? {
                 if sig_item.is_none() {
                     None
                 } else {
-                    let sig_hex: String = sig_item.extract()?;
-                    if sig_hex.is_empty() {
-                        Some(Vec::new())
-                    } else {
-                        let mut data = vec![0u8; sig_hex.len() / 2];
-                        faster_hex::hex_decode(sig_hex.as_bytes(), &mut data)
-                            .map_err(|e| PyKeyError::new_err(format!("Invalid hex: {}", e)))?;
-                        Some(data)
-                    }
+                    Some(decode_hex(sig_item.cast::<PyString>()?.to_str()?)?)
                 }
             } else {
                 None
@@ -223,27 +320,28 @@ impl TryFrom<&Bound<'_, PyDict>> for PyTransactionInput {
 
         // Parse sequence
         let sequence: u64 = dict
-            .get_item("sequence")?
+            .get_item(intern!(py, "sequence"))?
             .ok_or_else(|| PyKeyError::new_err("Key `sequence` not present"))?
             .extract()?;
 
         // Parse sigOpCount
         let sig_op_count: u8 = dict
-            .get_item("sigOpCount")?
+            .get_item(intern!(py, "sigOpCount"))?
             .ok_or_else(|| PyKeyError::new_err("Key `sigOpCount` not present"))?
             .extract()?;
 
         // Parse utxo (optional)
-        let utxo: Option<UtxoEntryReference> = if let Some(utxo_item) = dict.get_item("utxo")? {
-            if utxo_item.is_none() {
-                None
+        let utxo: Option<UtxoEntryReference> =
+            if let Some(utxo_item) = dict.get_item(intern!(py, "utxo"))? {
+                if utxo_item.is_none() {
+                    None
+                } else {
+                    let utxo_dict = utxo_item.cast::<PyDict>()?;
+                    Some(PyUtxoEntryReference::try_from(utxo_dict)?.into())
+                }
             } else {
-                let utxo_dict = utxo_item.cast::<PyDict>()?;
-                Some(PyUtxoEntryReference::try_from(utxo_dict)?.into())
-            }
-        } else {
-            None
-        };
+                None
+            };
 
         let input = TransactionInput::new(
             previous_outpoint.into(),
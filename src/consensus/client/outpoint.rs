@@ -1,17 +1,21 @@
 use crate::{consensus::convert::TryToPyDict, crypto::hashes::PyHash};
-use kaspa_consensus_client::{TransactionOutpoint, TransactionOutpointInner};
+use kaspa_consensus_client::TransactionOutpoint;
 use kaspa_consensus_core::tx::TransactionIndexType;
+use kaspa_hashes::Hash;
 use pyo3::{
+    exceptions::{PyException, PyKeyError, PyValueError},
+    intern,
     prelude::*,
-    types::{PyDict, PyType},
+    types::{PyBytes, PyDict, PyString, PyType},
 };
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
+use std::str::FromStr;
 
 /// Reference to a specific output in a previous transaction.
 ///
 /// An outpoint uniquely identifies a UTXO by its transaction ID and output index.
 #[gen_stub_pyclass]
-#[pyclass(name = "TransactionOutpoint")]
+#[pyclass(name = "TransactionOutpoint", frozen)]
 #[derive(Clone)]
 pub struct PyTransactionOutpoint(TransactionOutpoint);
 
@@ -21,15 +25,40 @@ impl PyTransactionOutpoint {
     /// Create a new transaction outpoint.
     ///
     /// Args:
-    ///     transaction_id: The ID of the transaction containing the output.
+    ///     transaction_id: The ID of the transaction containing the output, as a
+    ///         Hash, a 64-character hex string, or 32 bytes.
     ///     index: The index of the output within the transaction.
     ///
     /// Returns:
     ///     TransactionOutpoint: A new TransactionOutpoint instance.
+    ///
+    /// Raises:
+    ///     ValueError: If the transaction ID string or bytes are invalid.
     #[new]
-    pub fn ctor(transaction_id: PyHash, index: u32) -> Self {
-        let inner = TransactionOutpoint::new(transaction_id.into(), index);
-        Self(inner)
+    pub fn ctor(
+        #[gen_stub(override_type(type_repr = "Hash | str | bytes"))] transaction_id: Bound<PyAny>,
+        index: u32,
+    ) -> PyResult<Self> {
+        let transaction_id = if let Ok(hash) = transaction_id.cast::<PyHash>() {
+            Hash::from(hash.get().clone())
+        } else if let Ok(hex) = transaction_id.cast::<PyString>() {
+            // Decode straight from the Python str buffer, without a Hash wrapper
+            Hash::from_str(hex.to_str()?)
+                .map_err(|err| PyValueError::new_err(format!("Invalid transaction_id: {}", err)))?
+        } else if let Ok(bytes) = transaction_id.cast::<PyBytes>() {
+            let bytes: [u8; 32] = bytes
+                .as_bytes()
+                .try_into()
+                .map_err(|_| PyValueError::new_err("Invalid transaction_id: expected 32 bytes"))?;
+            Hash::from_bytes(bytes)
+        } else {
+            return Err(PyException::new_err(
+                "`transaction_id` must be type Hash, str, or bytes",
+            ));
+        };
+
+        let inner = TransactionOutpoint::new(transaction_id, index);
+        Ok(Self(inner))
     }
 
     /// Get the unique identifier string for this outpoint.
@@ -90,12 +119,31 @@ impl PyTransactionOutpoint {
         Self::try_from(dict)
     }
 
+    /// Check that a dictionary survives a from_dict/to_dict round-trip.
+    ///
+    /// Creates a TransactionOutpoint from `dict`, converts it back to a dictionary and
+    /// creates a second TransactionOutpoint from that, all within a single call.
+    ///
+    /// Args:
+    ///     dict: Dictionary in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     bool: True if both TransactionOutpoint instances are equal.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn verify_roundtrip(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<bool> {
+        let value = Self::try_from(dict)?;
+        let restored = Self::try_from(&value.0.try_to_pydict(dict.py())?)?;
+        Ok(value.__eq__(&restored))
+    }
+
     // Cannot be derived via pyclass(eq) as wrapped PyTransactionOutpoint does not derive PartialEq/Eq
     fn __eq__(&self, other: &PyTransactionOutpoint) -> bool {
-        match (bincode::serialize(&self.0), bincode::serialize(&other.0)) {
-            (Ok(a), Ok(b)) => a == b,
-            _ => false,
-        }
+        let (a, b) = (self.0.inner(), other.0.inner());
+        a.transaction_id == b.transaction_id && a.index == b.index
     }
 }
 
@@ -114,8 +162,22 @@ impl From<TransactionOutpoint> for PyTransactionOutpoint {
 impl TryFrom<&Bound<'_, PyDict>> for PyTransactionOutpoint {
     type Error = PyErr;
     fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
-        let inner: TransactionOutpointInner = serde_pyobject::from_pyobject(dict.clone())?;
-        let outpoint = TransactionOutpoint::new(inner.transaction_id, inner.index);
+        let py = dict.py();
+
+        // Parse transactionId, decoding the hex straight from the Python str buffer
+        let transaction_id_item = dict
+            .get_item(intern!(py, "transactionId"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `transactionId` not present"))?;
+        let transaction_id = Hash::from_str(transaction_id_item.cast::<PyString>()?.to_str()?)
+            .map_err(|err| PyValueError::new_err(format!("Invalid transactionId: {}", err)))?;
+
+        // Parse index
+        let index: TransactionIndexType = dict
+            .get_item(intern!(py, "index"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `index` not present"))?
+            .extract()?;
+
+        let outpoint = TransactionOutpoint::new(transaction_id, index);
         Ok(Self(outpoint))
     }
 }
@@ -1,15 +1,13 @@
 use kaspa_consensus_client::TransactionOutput;
 use pyo3::{
-    exceptions::PyValueError,
+    exceptions::{PyKeyError, PyValueError},
+    intern,
     prelude::*,
     types::{PyDict, PyType},
 };
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 
-use crate::{
-    consensus::{convert::TryToPyDict, core::script_public_key::PyScriptPublicKey},
-    types::PyBinary,
-};
+use crate::consensus::{convert::TryToPyDict, core::script_public_key::PyScriptPublicKey};
 
 /// A transaction output defining a payment destination.
 ///
@@ -100,6 +98,27 @@ impl PyTransactionOutput {
         Self::try_from(dict)
     }
 
+    /// Check that a dictionary survives a from_dict/to_dict round-trip.
+    ///
+    /// Creates a TransactionOutput from `dict`, converts it back to a dictionary and
+    /// creates a second TransactionOutput from that, all within a single call.
+    ///
+    /// Args:
+    ///     dict: Dictionary in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     bool: True if both TransactionOutput instances are equal.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn verify_roundtrip(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<bool> {
+        let value = Self::try_from(dict)?;
+        let restored = Self::try_from(&value.0.try_to_pydict(dict.py())?)?;
+        Ok(value.__eq__(&restored))
+    }
+
     // Cannot be derived via pyclass(eq) as wrapped PyTransactionOutput type does not derive PartialEq/Eq
     fn __eq__(&self, other: &PyTransactionOutput) -> bool {
         match (bincode::serialize(&self.0), bincode::serialize(&other.0)) {
@@ -124,16 +143,20 @@ impl From<PyTransactionOutput> for TransactionOutput {
 impl TryFrom<&Bound<'_, PyDict>> for PyTransactionOutput {
     type Error = PyErr;
     fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
-        let value = dict.as_any().get_item("value")?.extract::<u64>()?;
+        let py = dict.py();
+
+        let value: u64 = dict
+            .get_item(intern!(py, "value"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `value` not present"))?
+            .extract()?;
 
-        let spk_obj = dict.as_any().get_item("scriptPublicKey")?;
+        let spk_obj = dict
+            .get_item(intern!(py, "scriptPublicKey"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `scriptPublicKey` not present"))?;
         let spk = if let Ok(spk) = spk_obj.extract::<PyScriptPublicKey>() {
             spk
-        } else if let Ok(dict) = spk_obj.cast::<PyDict>() {
-            PyScriptPublicKey::constructor(
-                dict.as_any().get_item("version")?.extract::<u16>()?,
-                dict.as_any().get_item("script")?.extract::<PyBinary>()?,
-            )?
+        } else if let Ok(spk_dict) = spk_obj.cast::<PyDict>() {
+            PyScriptPublicKey::try_from(spk_dict)?
         } else {
             return Err(PyValueError::new_err(
                 "Value for `scriptPublicKey` must be type ScriptPublicKey or dict",
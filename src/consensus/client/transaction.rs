@@ -1,22 +1,23 @@
 use crate::address::PyAddress;
 use crate::consensus::client::input::PyTransactionInput;
 use crate::consensus::client::output::PyTransactionOutput;
-use crate::consensus::convert::TryToPyDict;
+use crate::consensus::convert::{TryToPyDict, try_to_pylist};
 use crate::consensus::core::network::PyNetworkType;
 use crate::crypto::hashes::PyHash;
-use crate::types::PyBinary;
+use crate::types::{PyBinary, decode_hex, decode_hex_array};
 use kaspa_consensus_client::{Transaction, TransactionInput, TransactionOutput};
 use kaspa_consensus_core::network::NetworkType;
 use kaspa_consensus_core::subnets;
 use kaspa_consensus_core::subnets::SubnetworkId;
 use kaspa_consensus_core::tx as cctx;
 use kaspa_txscript::extract_script_pub_key_address;
-use kaspa_utils::hex::FromHex;
-use pyo3::exceptions::PyKeyError;
+use pyo3::exceptions::{PyKeyError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyType};
+use pyo3::types::{PyBytes, PyList, PyString, PyTuple, PyType};
 use pyo3::{exceptions::PyException, types::PyDict};
 use pyo3_stub_gen::derive::*;
+use std::str::FromStr;
 use workflow_core::hex::ToHex;
 
 /// A Kaspa transaction.
@@ -59,6 +60,10 @@ impl PyTransaction {
 
     /// The transaction ID (hash).
     ///
+    /// The ID is computed once, when the transaction is created or
+    /// `finalize()` is called, and stored; reading it does not rehash the
+    /// transaction. Call `finalize()` after modifying fields to refresh it.
+    ///
     /// Returns:
     ///     str: The transaction ID as a hex string.
     #[getter]
@@ -89,15 +94,20 @@ impl PyTransaction {
         inputs: Vec<PyTransactionInput>,
         outputs: Vec<PyTransactionOutput>,
         lock_time: u64,
-        subnetwork_id: PyBinary,
+        #[gen_stub(override_type(type_repr = "Binary"))] subnetwork_id: Bound<PyAny>,
         gas: u64,
         payload: PyBinary,
         mass: u64,
     ) -> PyResult<Self> {
-        let subnetwork_id: SubnetworkId =
-            subnetwork_id.data.as_slice().try_into().map_err(|err| {
+        let subnetwork_id = if let Ok(hex) = subnetwork_id.cast::<PyString>() {
+            // Match well-known IDs straight from the Python str buffer
+            parse_subnetwork_id(hex.to_str()?)?
+        } else {
+            let binary: PyBinary = subnetwork_id.extract()?;
+            SubnetworkId::try_from(binary.data.as_slice()).map_err(|err| {
                 PyException::new_err(format!("subnetwork_id conversion error: {}", err))
-            })?;
+            })?
+        };
 
         let inner = Transaction::new(
             None,
@@ -266,14 +276,7 @@ impl PyTransaction {
     ///     Exception: If the hex string is invalid or has incorrect length.
     #[setter]
     pub fn set_subnetwork_id(&mut self, value: &str) -> PyResult<()> {
-        let subnetwork_id = Vec::from_hex(value)
-            .map_err(|err| PyException::new_err(err.to_string()))?
-            .as_slice()
-            .try_into()
-            .map_err(|err| {
-                PyException::new_err(format!("subnetwork_id conversion error: {}", err))
-            })?;
-        self.0.inner().subnetwork_id = subnetwork_id;
+        self.0.inner().subnetwork_id = parse_subnetwork_id(value)?;
         Ok(())
     }
 
@@ -322,6 +325,32 @@ impl PyTransaction {
         self.0.try_to_pydict(py)
     }
 
+    /// Get a tuple representation of the Transaction.
+    ///
+    /// Holds the same values as `to_dict()` in key order, for callers that
+    /// re-serialize fields positionally and do not need key lookup.
+    ///
+    /// Returns:
+    ///     tuple: (id, version, inputs, outputs, lockTime, subnetworkId, gas, payload, mass),
+    ///         with inputs and outputs in dictionary form.
+    fn to_tuple<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyTuple>> {
+        // Get ID before acquiring inner lock to avoid deadlock
+        let id = self.0.id().to_hex();
+        let inner = self.0.inner();
+        (
+            id,
+            inner.version,
+            try_to_pylist(py, &inner.inputs)?,
+            try_to_pylist(py, &inner.outputs)?,
+            inner.lock_time,
+            inner.subnetwork_id.to_hex(),
+            inner.gas,
+            inner.payload.to_hex(),
+            inner.mass,
+        )
+            .into_pyobject(py)
+    }
+
     /// Create a Transaction from a dictionary.
     ///
     /// Args:
@@ -347,8 +376,150 @@ impl PyTransaction {
         Self::try_from(dict)
     }
 
+    /// Create a list of Transactions from a list of dictionaries.
+    ///
+    /// Equivalent to calling `from_dict()` on each item, but the list is
+    /// walked in a single call.
+    ///
+    /// Args:
+    ///     dicts: List of dictionaries, each in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     list[Transaction]: The Transaction instances, in input order.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn from_dict_many(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(type_repr = "list[dict]"))] dicts: &Bound<'_, PyList>,
+    ) -> PyResult<Vec<Self>> {
+        dicts
+            .iter()
+            .map(|item| Self::try_from(item.cast::<PyDict>()?))
+            .collect()
+    }
+
+    /// Get dictionary representations of a list of Transactions.
+    ///
+    /// Equivalent to calling `to_dict()` on each item, but the list is
+    /// walked in a single call.
+    ///
+    /// Args:
+    ///     transactions: List of Transaction instances.
+    ///
+    /// Returns:
+    ///     list[dict]: The Transactions in dictionary form, in input order.
+    #[staticmethod]
+    fn to_dict_many<'py>(
+        py: Python<'py>,
+        #[gen_stub(override_type(type_repr = "list[Transaction]"))] transactions: &Bound<
+            'py,
+            PyList,
+        >,
+    ) -> PyResult<Vec<Bound<'py, PyDict>>> {
+        transactions
+            .iter()
+            .map(|item| item.cast::<Self>()?.borrow().0.try_to_pydict(py))
+            .collect()
+    }
+
+    /// Get a JSON representation of the Transaction.
+    ///
+    /// Returns:
+    ///     str: the Transaction as a JSON string.
+    ///
+    /// Raises:
+    ///     ValueError: If serialization fails.
+    fn to_json(&self) -> PyResult<String> {
+        serde_json::to_string(&self.0).map_err(|err| PyValueError::new_err(err.to_string()))
+    }
+
+    /// Create a Transaction from a JSON string.
+    ///
+    /// The JSON is parsed directly in Rust without building intermediate
+    /// Python objects. Only the format produced by `to_json()` is accepted;
+    /// the `to_dict()` layout (as returned by RPC calls) is not, use
+    /// `from_dict()` for that.
+    ///
+    /// Args:
+    ///     json: JSON string in the format produced by `to_json()`.
+    ///
+    /// Returns:
+    ///     Transaction: A new Transaction instance.
+    ///
+    /// Raises:
+    ///     ValueError: If the JSON is invalid.
+    #[classmethod]
+    fn from_json(_cls: &Bound<'_, PyType>, json: &str) -> PyResult<Self> {
+        let inner = serde_json::from_str::<Transaction>(json)
+            .map_err(|err| PyValueError::new_err(err.to_string()))?;
+        Ok(Self(inner))
+    }
+
+    /// Get a UTF-8 encoded JSON representation of the Transaction.
+    ///
+    /// Returns:
+    ///     bytes: the Transaction as UTF-8 encoded JSON.
+    ///
+    /// Raises:
+    ///     ValueError: If serialization fails.
+    fn to_json_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        let json =
+            serde_json::to_vec(&self.0).map_err(|err| PyValueError::new_err(err.to_string()))?;
+        Ok(PyBytes::new(py, &json))
+    }
+
+    /// Create a Transaction from UTF-8 encoded JSON.
+    ///
+    /// Accepts JSON as read from a file or socket without decoding it to
+    /// a `str` first. Only the format produced by `to_json_bytes()` is
+    /// accepted; the `to_dict()` layout is not, use `from_dict()` for that.
+    ///
+    /// Args:
+    ///     data: UTF-8 encoded JSON in the format produced by `to_json_bytes()`.
+    ///
+    /// Returns:
+    ///     Transaction: A new Transaction instance.
+    ///
+    /// Raises:
+    ///     ValueError: If the JSON is invalid.
+    #[classmethod]
+    fn from_json_bytes(_cls: &Bound<'_, PyType>, data: &[u8]) -> PyResult<Self> {
+        let inner = serde_json::from_slice::<Transaction>(data)
+            .map_err(|err| PyValueError::new_err(err.to_string()))?;
+        Ok(Self(inner))
+    }
+
+    /// Check that a dictionary survives a from_dict/to_dict round-trip.
+    ///
+    /// Creates a Transaction from `dict`, converts it back to a dictionary and
+    /// creates a second Transaction from that, all within a single call.
+    ///
+    /// Args:
+    ///     dict: Dictionary in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     bool: True if both Transaction instances are equal.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn verify_roundtrip(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<bool> {
+        let value = Self::try_from(dict)?;
+        let restored = Self::try_from(&value.0.try_to_pydict(dict.py())?)?;
+        Ok(value.__eq__(&restored))
+    }
+
     // Cannot be derived via pyclass(eq) as wrapped Transaction type does not derive PartialEq/Eq
     fn __eq__(&self, other: &PyTransaction) -> bool {
+        // The stored ID is part of the serialized form, so differing IDs
+        // settle the comparison without serializing either transaction
+        if self.0.id() != other.0.id() {
+            return false;
+        }
         match (bincode::serialize(&self.0), bincode::serialize(&other.0)) {
             (Ok(a), Ok(b)) => a == b,
             _ => false,
@@ -377,85 +548,74 @@ impl From<&PyTransaction> for cctx::Transaction {
 impl TryFrom<&Bound<'_, PyDict>> for PyTransaction {
     type Error = PyErr;
     fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
+        let py = dict.py();
+
         // Parse id
-        let id_str: String = dict
-            .get_item("id")?
-            .ok_or_else(|| PyKeyError::new_err("Key `id` not present"))?
-            .extract()?;
-        let id = kaspa_hashes::Hash::from_hex(&id_str)
-            .map_err(|e| PyException::new_err(format!("Invalid id: {}", e)))?;
+        let id_item = dict
+            .get_item(intern!(py, "id"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `id` not present"))?;
+        let id = kaspa_hashes::Hash::from_str(id_item.cast::<PyString>()?.to_str()?)
+            .map_err(|e| PyValueError::new_err(format!("Invalid id: {}", e)))?;
 
         // Parse version
         let version: u16 = dict
-            .get_item("version")?
+            .get_item(intern!(py, "version"))?
             .ok_or_else(|| PyKeyError::new_err("Key `version` not present"))?
             .extract()?;
 
         // Parse lockTime
         let lock_time: u64 = dict
-            .get_item("lockTime")?
+            .get_item(intern!(py, "lockTime"))?
             .ok_or_else(|| PyKeyError::new_err("Key `lockTime` not present"))?
             .extract()?;
 
         // Parse subnetworkId
-        let subnetwork_id_str: String = dict
-            .get_item("subnetworkId")?
-            .ok_or_else(|| PyKeyError::new_err("Key `subnetworkId` not present"))?
-            .extract()?;
-        let subnetwork_id: SubnetworkId = Vec::from_hex(&subnetwork_id_str)
-            .map_err(|err| PyException::new_err(err.to_string()))?
-            .as_slice()
-            .try_into()
-            .map_err(|err| {
-                PyException::new_err(format!("subnetwork_id conversion error: {}", err))
-            })?;
+        let subnetwork_id_item = dict
+            .get_item(intern!(py, "subnetworkId"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `subnetworkId` not present"))?;
+        let subnetwork_id = parse_subnetwork_id(subnetwork_id_item.cast::<PyString>()?.to_str()?)?;
 
         // Parse gas
         let gas: u64 = dict
-            .get_item("gas")?
+            .get_item(intern!(py, "gas"))?
             .ok_or_else(|| PyKeyError::new_err("Key `gas` not present"))?
             .extract()?;
 
         // Parse payload
-        let payload_str: String = dict
-            .get_item("payload")?
-            .ok_or_else(|| PyKeyError::new_err("Key `payload` not present"))?
-            .extract()?;
-        let payload: Vec<u8> = if payload_str.is_empty() {
-            Vec::new()
-        } else {
-            Vec::from_hex(&payload_str).map_err(|err| PyException::new_err(err.to_string()))?
-        };
+        let payload_item = dict
+            .get_item(intern!(py, "payload"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `payload` not present"))?;
+        let payload = decode_hex(payload_item.cast::<PyString>()?.to_str()?)?;
 
         // Parse mass
         let mass: u64 = dict
-            .get_item("mass")?
+            .get_item(intern!(py, "mass"))?
             .ok_or_else(|| PyKeyError::new_err("Key `mass` not present"))?
             .extract()?;
 
         // Parse inputs
         let inputs_list = dict
-            .get_item("inputs")?
+            .get_item(intern!(py, "inputs"))?
             .ok_or_else(|| PyKeyError::new_err("Key `inputs` not present"))?;
-        let inputs_list = inputs_list.cast::<PyList>()?;
-        let mut inputs: Vec<TransactionInput> = Vec::new();
-        for input_item in inputs_list.iter() {
-            let input_dict = input_item.cast::<PyDict>()?;
-            let py_input = PyTransactionInput::try_from(input_dict)?;
-            inputs.push(py_input.into());
-        }
+        let inputs = inputs_list
+            .cast::<PyList>()?
+            .iter()
+            .map(|item| {
+                PyTransactionInput::try_from(item.cast::<PyDict>()?).map(TransactionInput::from)
+            })
+            .collect::<PyResult<Vec<TransactionInput>>>()?;
 
         // Parse outputs
         let outputs_list = dict
-            .get_item("outputs")?
+            .get_item(intern!(py, "outputs"))?
             .ok_or_else(|| PyKeyError::new_err("Key `outputs` not present"))?;
-        let outputs_list = outputs_list.cast::<PyList>()?;
-        let mut outputs: Vec<TransactionOutput> = Vec::new();
-        for output_item in outputs_list.iter() {
-            let output_dict = output_item.cast::<PyDict>()?;
-            let py_output = PyTransactionOutput::try_from(output_dict)?;
-            outputs.push(py_output.into());
-        }
+        let outputs = outputs_list
+            .cast::<PyList>()?
+            .iter()
+            .map(|item| {
+                PyTransactionOutput::try_from(item.cast::<PyDict>()?).map(TransactionOutput::from)
+            })
+            .collect::<PyResult<Vec<TransactionOutput>>>()?;
 
         let tx = Transaction::new(
             Some(id),
@@ -472,3 +632,16 @@ impl TryFrom<&Bound<'_, PyDict>> for PyTransaction {
         Ok(Self(tx))
     }
 }
+
+/// Parse a subnetwork ID from its hex representation.
+///
+/// The well-known native, coinbase and registry IDs are matched by string
+/// before falling back to hex decoding, as nearly all transactions use one of them.
+fn parse_subnetwork_id(hex: &str) -> PyResult<SubnetworkId> {
+    match hex {
+        "0000000000000000000000000000000000000000" => Ok(subnets::SUBNETWORK_ID_NATIVE),
+        "0100000000000000000000000000000000000000" => Ok(subnets::SUBNETWORK_ID_COINBASE),
+        "0200000000000000000000000000000000000000" => Ok(subnets::SUBNETWORK_ID_REGISTRY),
+        _ => Ok(SubnetworkId::from_bytes(decode_hex_array(hex)?)),
+    }
+}
@@ -1,15 +1,18 @@
 use super::outpoint::PyTransactionOutpoint;
 use crate::{
     address::PyAddress,
-    consensus::{convert::TryToPyDict, core::script_public_key::PyScriptPublicKey},
-    types::PyBinary,
+    consensus::{
+        convert::{TryToPyDict, try_to_pylist},
+        core::script_public_key::PyScriptPublicKey,
+    },
 };
 use kaspa_consensus_client::{UtxoEntry, UtxoEntryReference};
 use kaspa_utils::hex::FromHex;
 use pyo3::{
     exceptions::{PyKeyError, PyValueError},
+    intern,
     prelude::*,
-    types::{PyDict, PyList, PyType},
+    types::{PyDict, PyList, PyString, PyType},
 };
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 use std::sync::Arc;
@@ -111,6 +114,27 @@ impl PyUtxoEntry {
         Self::try_from(dict)
     }
 
+    /// Check that a dictionary survives a from_dict/to_dict round-trip.
+    ///
+    /// Creates a UtxoEntry from `dict`, converts it back to a dictionary and
+    /// creates a second UtxoEntry from that, all within a single call.
+    ///
+    /// Args:
+    ///     dict: Dictionary in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     bool: True if both UtxoEntry instances are equal.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn verify_roundtrip(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<bool> {
+        let value = Self::try_from(dict)?;
+        let restored = Self::try_from(&value.0.try_to_pydict(dict.py())?)?;
+        Ok(value.__eq__(&restored))
+    }
+
     // Cannot be derived via pyclass(eq) as wrapped PyUtxoEntry type does not derive PartialEq/Eq
     fn __eq__(&self, other: &PyUtxoEntry) -> bool {
         match (bincode::serialize(&self.0), bincode::serialize(&other.0)) {
@@ -135,40 +159,38 @@ impl From<UtxoEntry> for PyUtxoEntry {
 impl TryFrom<&Bound<'_, PyDict>> for PyUtxoEntry {
     type Error = PyErr;
     fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
-        let address = if let Some(addr_item) = dict.get_item("address")? {
+        let py = dict.py();
+
+        let address = if let Some(addr_item) = dict.get_item(intern!(py, "address"))? {
             if addr_item.is_none() {
                 None
             } else {
-                Some(PyAddress::try_from(addr_item.extract::<String>()?)?)
+                Some(PyAddress::try_from(
+                    addr_item.cast::<PyString>()?.to_str()?,
+                )?)
             }
         } else {
             None
         };
 
         let outpoint = PyTransactionOutpoint::try_from(
-            dict.get_item("outpoint")?
+            dict.get_item(intern!(py, "outpoint"))?
                 .ok_or_else(|| PyKeyError::new_err("Key `outpoint` not present"))?
                 .cast::<PyDict>()?,
         )?;
 
         let amount: u64 = dict
-            .get_item("amount")?
+            .get_item(intern!(py, "amount"))?
             .ok_or_else(|| PyKeyError::new_err("Key `amount` not present"))?
             .extract()?;
 
         let spk_obj = dict
-            .get_item("scriptPublicKey")?
+            .get_item(intern!(py, "scriptPublicKey"))?
             .ok_or_else(|| PyKeyError::new_err("Key `scriptPublicKey` not present"))?;
         let script_public_key = if let Ok(spk) = spk_obj.extract::<PyScriptPublicKey>() {
             spk
         } else if let Ok(spk_dict) = spk_obj.cast::<PyDict>() {
-            PyScriptPublicKey::constructor(
-                spk_dict.as_any().get_item("version")?.extract::<u16>()?,
-                spk_dict
-                    .as_any()
-                    .get_item("script")?
-                    .extract::<PyBinary>()?,
-            )?
+            PyScriptPublicKey::try_from(spk_dict)?
         } else {
             return Err(PyValueError::new_err(
                 "Value for `scriptPublicKey` must be type ScriptPublicKey or dict",
@@ -176,12 +198,12 @@ impl TryFrom<&Bound<'_, PyDict>> for PyUtxoEntry {
         };
 
         let block_daa_score: u64 = dict
-            .get_item("blockDaaScore")?
+            .get_item(intern!(py, "blockDaaScore"))?
             .ok_or_else(|| PyKeyError::new_err("Key `blockDaaScore` not present"))?
             .extract()?;
 
         let is_coinbase: bool = dict
-            .get_item("isCoinbase")?
+            .get_item(intern!(py, "isCoinbase"))?
             .ok_or_else(|| PyKeyError::new_err("Key `isCoinbase` not present"))?
             .extract()?;
 
@@ -254,15 +276,8 @@ impl PyUtxoEntries {
     /// Returns:
     ///     dict: the UtxoEntries in dictionary form.
     fn to_dict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
-        let utxos = self
-            .0
-            .clone()
-            .iter()
-            .map(|utxo_ref| utxo_ref.try_to_pydict(py))
-            .collect::<PyResult<Vec<Bound<'_, PyDict>>>>()?;
-
         let dict = PyDict::new(py);
-        dict.set_item("utxos", PyList::new(py, utxos)?)?;
+        dict.set_item(intern!(py, "utxos"), try_to_pylist(py, &self.0)?)?;
 
         Ok(dict)
     }
@@ -386,6 +401,86 @@ impl PyUtxoEntryReference {
     fn from_dict(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<Self> {
         Self::try_from(dict)
     }
+
+    /// Check that a dictionary survives a from_dict/to_dict round-trip.
+    ///
+    /// Creates a UtxoEntryReference from `dict`, converts it back to a dictionary and
+    /// creates a second UtxoEntryReference from that, all within a single call.
+    ///
+    /// Args:
+    ///     dict: Dictionary in the format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     bool: True if every entry field (address, outpoint, amount, script public key,
+    ///         block DAA score, coinbase flag) of both instances matches. This is stricter
+    ///         than `==`.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn verify_roundtrip(_cls: &Bound<'_, PyType>, dict: &Bound<'_, PyDict>) -> PyResult<bool> {
+        let value = Self::try_from(dict)?;
+        let restored = Self::try_from(&value.0.try_to_pydict(dict.py())?)?;
+        // Compare full entry contents; UtxoEntryReference equality does not check every field
+        match (
+            bincode::serialize(value.0.utxo.as_ref()),
+            bincode::serialize(restored.0.utxo.as_ref()),
+        ) {
+            (Ok(a), Ok(b)) => Ok(a == b),
+            _ => Ok(false),
+        }
+    }
+
+    /// Create a list of UtxoEntryReferences from a list of dictionaries.
+    ///
+    /// Equivalent to calling `from_dict()` on each item, but the list is
+    /// walked in a single call. Accepts the `entries` list returned by
+    /// `RpcClient.get_utxos_by_addresses()` as is.
+    ///
+    /// Args:
+    ///     dicts: List of dictionaries, each in a format accepted by `from_dict()`.
+    ///
+    /// Returns:
+    ///     list[UtxoEntryReference]: The UtxoEntryReference instances, in input order.
+    ///
+    /// Raises:
+    ///     KeyError: If required keys are missing.
+    ///     ValueError: If values are invalid.
+    #[classmethod]
+    fn from_dict_many(
+        _cls: &Bound<'_, PyType>,
+        #[gen_stub(override_type(type_repr = "list[dict]"))] dicts: &Bound<'_, PyList>,
+    ) -> PyResult<Vec<Self>> {
+        dicts
+            .iter()
+            .map(|item| Self::try_from(item.cast::<PyDict>()?))
+            .collect()
+    }
+
+    /// Get dictionary representations of a list of UtxoEntryReferences.
+    ///
+    /// Equivalent to calling `to_dict()` on each item, but the list is
+    /// walked in a single call.
+    ///
+    /// Args:
+    ///     entries: List of UtxoEntryReference instances.
+    ///
+    /// Returns:
+    ///     list[dict]: The UtxoEntryReferences in dictionary form, in input order.
+    #[staticmethod]
+    fn to_dict_many<'py>(
+        py: Python<'py>,
+        #[gen_stub(override_type(type_repr = "list[UtxoEntryReference]"))] entries: &Bound<
+            'py,
+            PyList,
+        >,
+    ) -> PyResult<Vec<Bound<'py, PyDict>>> {
+        entries
+            .iter()
+            .map(|item| item.cast::<Self>()?.borrow().0.try_to_pydict(py))
+            .collect()
+    }
 }
 
 impl From<PyUtxoEntryReference> for UtxoEntryReference {
@@ -409,52 +504,51 @@ impl From<UtxoEntryReference> for PyUtxoEntryReference {
 impl TryFrom<&Bound<'_, PyDict>> for PyUtxoEntryReference {
     type Error = PyErr;
     fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
+        let py = dict.py();
+
         // Parse address (optional in flat format, required in nested)
-        let address = if let Some(addr_item) = dict.get_item("address")? {
+        let address = if let Some(addr_item) = dict.get_item(intern!(py, "address"))? {
             if addr_item.is_none() {
                 None
             } else {
-                Some(PyAddress::try_from(addr_item.extract::<String>()?)?)
+                Some(PyAddress::try_from(
+                    addr_item.cast::<PyString>()?.to_str()?,
+                )?)
             }
         } else {
             None
         };
 
         let outpoint = PyTransactionOutpoint::try_from(
-            dict.get_item("outpoint")?
+            dict.get_item(intern!(py, "outpoint"))?
                 .ok_or_else(|| PyKeyError::new_err("Key `outpoint` not present"))?
                 .cast::<PyDict>()?,
         )?;
 
         // Determine if using nested format (utxoEntry key) or flat format
-        let source_dict = if let Some(utxo_entry_any) = dict.get_item("utxoEntry")? {
+        // (borrowing either dict, without taking a new reference to it)
+        let utxo_entry = dict.get_item(intern!(py, "utxoEntry"))?;
+        let source_dict = match &utxo_entry {
             // Nested format: read from utxoEntry dict
-            utxo_entry_any.cast::<PyDict>()?.clone()
-        } else {
+            Some(utxo_entry_any) => utxo_entry_any.cast::<PyDict>()?,
             // Flat format: read directly from dict
-            dict.clone()
+            None => dict,
         };
 
         let amount: u64 = source_dict
-            .get_item("amount")?
+            .get_item(intern!(py, "amount"))?
             .ok_or_else(|| PyKeyError::new_err("Key `amount` not present"))?
             .extract()?;
 
         let spk_obj = source_dict
-            .get_item("scriptPublicKey")?
+            .get_item(intern!(py, "scriptPublicKey"))?
             .ok_or_else(|| PyKeyError::new_err("Key `scriptPublicKey` not present"))?;
         let script_public_key = if let Ok(spk) = spk_obj.extract::<PyScriptPublicKey>() {
             spk
-        } else if let Ok(spk_str) = spk_obj.extract::<String>() {
-            PyScriptPublicKey::from_hex(&spk_str)?
+        } else if let Ok(spk_str) = spk_obj.cast::<PyString>() {
+            PyScriptPublicKey::from_hex(spk_str.to_str()?)?
         } else if let Ok(spk_dict) = spk_obj.cast::<PyDict>() {
-            PyScriptPublicKey::constructor(
-                spk_dict.as_any().get_item("version")?.extract::<u16>()?,
-                spk_dict
-                    .as_any()
-                    .get_item("script")?
-                    .extract::<PyBinary>()?,
-            )?
+            PyScriptPublicKey::try_from(spk_dict)?
         } else {
             return Err(PyValueError::new_err(
                 "Value for `scriptPublicKey` must be type ScriptPublicKey, str, or dict",
@@ -462,12 +556,12 @@ impl TryFrom<&Bound<'_, PyDict>> for PyUtxoEntryReference {
         };
 
         let block_daa_score: u64 = source_dict
-            .get_item("blockDaaScore")?
+            .get_item(intern!(py, "blockDaaScore"))?
             .ok_or_else(|| PyKeyError::new_err("Key `blockDaaScore` not present"))?
             .extract()?;
 
         let is_coinbase: bool = source_dict
-            .get_item("isCoinbase")?
+            .get_item(intern!(py, "isCoinbase"))?
             .ok_or_else(|| PyKeyError::new_err("Key `isCoinbase` not present"))?
             .extract()?;
 
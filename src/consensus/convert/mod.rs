@@ -13,7 +13,7 @@
 pub mod native;
 
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyDict, PyList};
 
 /// Trait for converting Rust types to Python dictionaries.
 ///
@@ -25,3 +25,18 @@ use pyo3::types::PyDict;
 pub trait TryToPyDict {
     fn try_to_pydict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>>;
 }
+
+/// Convert a slice of native types to a Python list of dictionaries.
+///
+/// Shared helper for the dict and tuple conversions that hold lists of native types
+/// (transaction inputs and outputs, UTXO entries).
+pub fn try_to_pylist<'py, T: TryToPyDict>(
+    py: Python<'py>,
+    items: &[T],
+) -> PyResult<Bound<'py, PyList>> {
+    let dicts = items
+        .iter()
+        .map(|item| item.try_to_pydict(py))
+        .collect::<PyResult<Vec<_>>>()?;
+    PyList::new(py, dicts)
+}
@@ -1,18 +1,19 @@
-use super::TryToPyDict;
+use super::{TryToPyDict, try_to_pylist};
 use kaspa_consensus_client::{
     Transaction, TransactionInput, TransactionOutpoint, TransactionOutput, UtxoEntry,
     UtxoEntryReference,
 };
 use kaspa_consensus_core::tx::ScriptPublicKey;
 use kaspa_utils::hex::ToHex;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
 impl TryToPyDict for ScriptPublicKey {
     fn try_to_pydict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
         let dict = PyDict::new(py);
-        dict.set_item("version", self.version)?;
-        dict.set_item("script", self.script_as_hex())?;
+        dict.set_item(intern!(py, "version"), self.version)?;
+        dict.set_item(intern!(py, "script"), self.script_as_hex())?;
 
         Ok(dict)
     }
@@ -20,69 +21,55 @@ impl TryToPyDict for ScriptPublicKey {
 
 impl TryToPyDict for TransactionOutpoint {
     fn try_to_pydict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
-        let dict = serde_pyobject::to_pyobject(py, self.inner())?;
-        Ok(dict.cast_into::<PyDict>()?)
-    }
-}
-
-impl TryToPyDict for UtxoEntryReference {
-    fn try_to_pydict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let inner = self.inner();
         let dict = PyDict::new(py);
-
-        // Set `address` key
-        if let Some(addr) = self.address() {
-            dict.set_item("address", addr.to_string())?;
-        } else {
-            dict.set_item("address", py.None())?;
-        }
-
-        // Set `outpoint` key
-        dict.set_item(
-            "outpoint",
-            serde_pyobject::to_pyobject(py, self.outpoint().inner())?,
-        )?;
-
-        // Use flat format (WASM SDK parity)
-        dict.set_item("amount", self.amount())?;
         dict.set_item(
-            "scriptPublicKey",
-            self.script_public_key().try_to_pydict(py)?,
+            intern!(py, "transactionId"),
+            inner.transaction_id.to_string(),
         )?;
-        dict.set_item("blockDaaScore", self.block_daa_score())?;
-        dict.set_item("isCoinbase", self.is_coinbase())?;
+        dict.set_item(intern!(py, "index"), inner.index)?;
 
         Ok(dict)
     }
 }
 
+impl TryToPyDict for UtxoEntryReference {
+    fn try_to_pydict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        // Flat format (WASM SDK parity), identical to the referenced UtxoEntry.
+        // Reading the entry's fields directly avoids the address and script
+        // clones made by the UtxoEntryReference accessors.
+        self.utxo.try_to_pydict(py)
+    }
+}
+
 impl TryToPyDict for UtxoEntry {
     fn try_to_pydict<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
         let dict = PyDict::new(py);
 
         // Set `address` key
         if let Some(addr) = &self.address {
-            dict.set_item("address", addr.to_string())?;
+            dict.set_item(intern!(py, "address"), addr.to_string())?;
         } else {
-            dict.set_item("address", py.None())?;
+            dict.set_item(intern!(py, "address"), py.None())?;
         }
 
         // Set `outpoint` key
-        dict.set_item(
-            "outpoint",
-            serde_pyobject::to_pyobject(py, self.outpoint.inner())?,
-        )?;
+        dict.set_item(intern!(py, "outpoint"), self.outpoint.try_to_pydict(py)?)?;
 
         // Set `amount` key
-        dict.set_item("amount", self.amount())?;
+        dict.set_item(intern!(py, "amount"), self.amount())?;
 
         // Set `scriptPublicKey` key
-        dict.set_item("scriptPublicKey", self.script_public_key.try_to_pydict(py)?)?;
+        dict.set_item(
+            intern!(py, "scriptPublicKey"),
+            self.script_public_key.try_to_pydict(py)?,
+        )?;
 
         // Set `blockDaaScore` key
-        dict.set_item("blockDaaScore", self.block_daa_score())?;
+        dict.set_item(intern!(py, "blockDaaScore"), self.block_daa_score())?;
 
         // Set `isCoinbase` key
-        dict.set_item("isCoinbase", self.is_coinbase())?;
+        dict.set_item(intern!(py, "isCoinbase"), self.is_coinbase())?;
 
         Ok(dict)
     }
@@ -94,25 +81,28 @@ impl TryToPyDict for TransactionInput {
 
         // Set `previousOutpoint` key
         dict.set_item(
-            "previousOutpoint",
+            intern!(py, "previousOutpoint"),
             self.get_previous_outpoint().try_to_pydict(py)?,
         )?;
 
         // Set `signatureScript` key
-        dict.set_item("signatureScript", self.get_signature_script_as_hex())?;
+        dict.set_item(
+            intern!(py, "signatureScript"),
+            self.get_signature_script_as_hex(),
+        )?;
 
         // Set `sequence` key
-        dict.set_item("sequence", self.get_sequence())?;
+        dict.set_item(intern!(py, "sequence"), self.get_sequence())?;
 
         // Set `sigOpCount` key
-        dict.set_item("sigOpCount", self.get_sig_op_count())?;
+        dict.set_item(intern!(py, "sigOpCount"), self.get_sig_op_count())?;
 
         // Set `utxo` key
         let utxo_dict = self
             .get_utxo()
             .map(|utxo_ref| utxo_ref.try_to_pydict(py))
             .transpose()?;
-        dict.set_item("utxo", utxo_dict)?;
+        dict.set_item(intern!(py, "utxo"), utxo_dict)?;
 
         Ok(dict)
     }
@@ -123,10 +113,10 @@ impl TryToPyDict for TransactionOutput {
         let inner = self.inner();
         let dict = PyDict::new(py);
 
-        dict.set_item("value", inner.value)?;
+        dict.set_item(intern!(py, "value"), inner.value)?;
 
         dict.set_item(
-            "scriptPublicKey",
+            intern!(py, "scriptPublicKey"),
             inner.script_public_key.try_to_pydict(py)?,
         )?;
 
@@ -142,45 +132,31 @@ impl TryToPyDict for Transaction {
         let dict = PyDict::new(py);
 
         // Set `id` key
-        dict.set_item("id", id)?;
+        dict.set_item(intern!(py, "id"), id)?;
 
         // Set `version` key
-        dict.set_item("version", inner.version)?;
+        dict.set_item(intern!(py, "version"), inner.version)?;
 
         // Set `inputs` key
-        dict.set_item(
-            "inputs",
-            inner
-                .inputs
-                .iter()
-                .map(|input| input.try_to_pydict(py))
-                .collect::<PyResult<Vec<Bound<'_, PyDict>>>>()?,
-        )?;
+        dict.set_item(intern!(py, "inputs"), try_to_pylist(py, &inner.inputs)?)?;
 
         // Set `outputs` key
-        dict.set_item(
-            "outputs",
-            inner
-                .outputs
-                .iter()
-                .map(|output| output.try_to_pydict(py))
-                .collect::<PyResult<Vec<Bound<'_, PyDict>>>>()?,
-        )?;
+        dict.set_item(intern!(py, "outputs"), try_to_pylist(py, &inner.outputs)?)?;
 
         // Set `locktime` key
-        dict.set_item("lockTime", inner.lock_time)?;
+        dict.set_item(intern!(py, "lockTime"), inner.lock_time)?;
 
         // Set `subnetworkId` key
-        dict.set_item("subnetworkId", inner.subnetwork_id.to_hex())?;
+        dict.set_item(intern!(py, "subnetworkId"), inner.subnetwork_id.to_hex())?;
 
         // Set `gas` key
-        dict.set_item("gas", inner.gas)?;
+        dict.set_item(intern!(py, "gas"), inner.gas)?;
 
         // Set `payload` key
-        dict.set_item("payload", inner.payload.to_hex())?;
+        dict.set_item(intern!(py, "payload"), inner.payload.to_hex())?;
 
         // Set `mass`
-        dict.set_item("mass", inner.mass)?;
+        dict.set_item(intern!(py, "mass"), inner.mass)?;
 
         Ok(dict)
     }
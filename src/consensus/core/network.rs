@@ -1,6 +1,6 @@
 use kaspa_addresses::Prefix;
 use kaspa_consensus_core::network::{NetworkId, NetworkType};
-use pyo3::{exceptions::PyException, prelude::*};
+use pyo3::{exceptions::PyException, prelude::*, types::PyString};
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pyclass_enum, gen_stub_pymethods};
 use std::str::FromStr;
 
@@ -83,8 +83,8 @@ impl PyNetworkId {
     ///     Exception: If the network_id format is invalid.
     #[new]
     pub fn new(network_id: Bound<PyAny>) -> PyResult<Self> {
-        if let Ok(network_id) = network_id.extract::<String>() {
-            PyNetworkId::from_str(&network_id)
+        if let Ok(network_id) = network_id.cast::<PyString>() {
+            PyNetworkId::from_str(network_id.to_str()?)
         } else if let Ok(network_type) = network_id.extract::<PyNetworkType>() {
             let inner = NetworkId::new(network_type.into());
             Ok(Self(inner))
@@ -200,7 +200,15 @@ impl FromStr for PyNetworkId {
     type Err = PyErr;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
-        let inner = NetworkId::from_str(s).map_err(|err| PyException::new_err(err.to_string()))?;
+        // Well-known network names are matched before the general parser
+        let inner = match s {
+            "mainnet" => NetworkId::new(NetworkType::Mainnet),
+            "testnet-10" => NetworkId::with_suffix(NetworkType::Testnet, 10),
+            "testnet-11" => NetworkId::with_suffix(NetworkType::Testnet, 11),
+            "devnet" => NetworkId::new(NetworkType::Devnet),
+            "simnet" => NetworkId::new(NetworkType::Simnet),
+            _ => NetworkId::from_str(s).map_err(|err| PyException::new_err(err.to_string()))?,
+        };
 
         Ok(Self(inner))
     }
@@ -210,13 +218,13 @@ impl<'py> FromPyObject<'_, 'py> for PyNetworkId {
     type Error = PyErr;
 
     fn extract(obj: Borrowed<'_, 'py, PyAny>) -> Result<Self, Self::Error> {
-        if let Ok(s) = obj.extract::<String>() {
-            PyNetworkId::from_str(&s)
+        if let Ok(network_id) = obj.cast::<Self>() {
+            Ok(network_id.borrow().clone())
+        } else if let Ok(s) = obj.cast::<PyString>() {
+            PyNetworkId::from_str(s.to_str()?)
         } else if let Ok(network_type) = obj.cast::<PyNetworkType>() {
             let inner = NetworkId::new(network_type.borrow().clone().into());
             Ok(Self(inner))
-        } else if let Ok(network_id) = obj.cast::<Self>() {
-            Ok(network_id.borrow().clone())
         } else {
             Err(PyException::new_err(
                 "`network_id` must be a String or NetworkId instance",
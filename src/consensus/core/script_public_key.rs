@@ -1,7 +1,12 @@
 use crate::types::PyBinary;
 use kaspa_consensus_core::tx::ScriptPublicKey;
 use kaspa_utils::hex::FromHex;
-use pyo3::{exceptions::PyException, prelude::*, types::PyBytes};
+use pyo3::{
+    exceptions::{PyException, PyKeyError},
+    intern,
+    prelude::*,
+    types::{PyBytes, PyDict},
+};
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 use std::str::FromStr;
 
@@ -10,7 +15,7 @@ use std::str::FromStr;
 /// Represents the locking conditions for an output. This script defines
 /// the conditions that must be met to spend the associated funds.
 #[gen_stub_pyclass]
-#[pyclass(name = "ScriptPublicKey", eq)]
+#[pyclass(name = "ScriptPublicKey", eq, frozen)]
 #[derive(Clone, PartialEq)]
 pub struct PyScriptPublicKey(ScriptPublicKey);
 
@@ -75,3 +80,22 @@ impl FromHex for PyScriptPublicKey {
         Ok(Self(inner))
     }
 }
+
+impl TryFrom<&Bound<'_, PyDict>> for PyScriptPublicKey {
+    type Error = PyErr;
+    fn try_from(dict: &Bound<PyDict>) -> PyResult<Self> {
+        let py = dict.py();
+
+        let version: u16 = dict
+            .get_item(intern!(py, "version"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `version` not present"))?
+            .extract()?;
+
+        let script: PyBinary = dict
+            .get_item(intern!(py, "script"))?
+            .ok_or_else(|| PyKeyError::new_err("Key `script` not present"))?
+            .extract()?;
+
+        Self::constructor(version, script)
+    }
+}
@@ -1,5 +1,5 @@
 use kaspa_hashes::Hash;
-use pyo3::{exceptions::PyException, prelude::*, types::PyBytes};
+use pyo3::{exceptions::PyException, prelude::*, sync::PyOnceLock, types::PyBytes};
 use pyo3_stub_gen::derive::*;
 use std::str::FromStr;
 
@@ -7,7 +7,7 @@ use std::str::FromStr;
 ///
 /// Used for transaction IDs, block hashes, and other cryptographic purposes.
 #[gen_stub_pyclass]
-#[pyclass(name = "Hash", eq)]
+#[pyclass(name = "Hash", eq, frozen)]
 #[derive(Clone, PartialEq)]
 pub struct PyHash(Hash);
 
@@ -31,6 +31,20 @@ impl PyHash {
         Ok(Self(inner))
     }
 
+    /// The all-zero hash.
+    ///
+    /// The instance is created once and shared between calls, as Hash is
+    /// immutable.
+    ///
+    /// Returns:
+    ///     Hash: A Hash of 32 zero bytes.
+    #[staticmethod]
+    pub fn zero(py: Python<'_>) -> PyResult<Py<Self>> {
+        static ZERO: PyOnceLock<Py<PyHash>> = PyOnceLock::new();
+        ZERO.get_or_try_init(py, || Py::new(py, Self(Hash::from_bytes([0u8; 32]))))
+            .map(|zero| zero.clone_ref(py))
+    }
+
     /// Convert the hash to a hex string.
     ///
     /// Returns:
@@ -1,6 +1,6 @@
-use pyo3::exceptions::PyException;
+use pyo3::exceptions::{PyException, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyList};
+use pyo3::types::{PyBytes, PyList, PyString};
 use pyo3_stub_gen::derive::gen_stub_pyclass;
 
 /// Binary data type for flexible input handling.
@@ -23,24 +23,24 @@ impl<'py> FromPyObject<'_, 'py> for PyBinary {
     type Error = PyErr;
 
     fn extract(value: Borrowed<'_, 'py, PyAny>) -> Result<Self, Self::Error> {
-        if let Ok(str) = value.extract::<String>() {
-            // Python `str` (of valid hex)
-            let mut data = vec![0u8; str.len() / 2];
-            match faster_hex::hex_decode(str.as_bytes(), &mut data) {
-                Ok(()) => Ok(PyBinary { data }),
-                Err(_) => Err(PyException::new_err("Invalid hex string")),
-            }
-        } else if let Ok(py_bytes) = value.cast::<PyBytes>() {
+        // `bytes` is checked first as scripts are commonly already in binary form,
+        // and it only needs a single copy out of the Python buffer
+        if let Ok(py_bytes) = value.cast::<PyBytes>() {
             // Python `bytes` type
             Ok(PyBinary {
                 data: py_bytes.as_bytes().to_vec(),
             })
+        } else if let Ok(str) = value.cast::<PyString>() {
+            // Python `str` (of valid hex)
+            Ok(PyBinary {
+                data: decode_hex(str.to_str()?)?,
+            })
         } else if let Ok(op_list) = value.cast::<PyList>() {
             // Python `[int]` (list of bytes)
-            let data = op_list
-                .iter()
-                .map(|item| item.extract::<u8>())
-                .collect::<PyResult<Vec<u8>>>()?;
+            let mut data = Vec::with_capacity(op_list.len());
+            for item in op_list.iter() {
+                data.push(item.extract::<u8>()?);
+            }
             Ok(PyBinary { data })
         } else {
             Err(PyException::new_err(
@@ -53,31 +53,34 @@ impl<'py> FromPyObject<'_, 'py> for PyBinary {
 impl TryFrom<&Bound<'_, PyAny>> for PyBinary {
     type Error = PyErr;
     fn try_from(value: &Bound<PyAny>) -> Result<Self, Self::Error> {
-        if let Ok(str) = value.extract::<String>() {
-            // Python `str` (of valid hex)
-            let mut data = vec![0u8; str.len() / 2];
-            match faster_hex::hex_decode(str.as_bytes(), &mut data) {
-                Ok(()) => Ok(PyBinary { data }), // Hex string
-                Err(_) => Err(PyException::new_err("Invalid hex string")),
-            }
-        } else if let Ok(py_bytes) = value.cast::<PyBytes>() {
-            // Python `bytes` type
-            Ok(PyBinary {
-                data: py_bytes.as_bytes().to_vec(),
-            })
-        } else if let Ok(op_list) = value.cast::<PyList>() {
-            // Python `[int]` (list of bytes)
-            let data = op_list
-                .iter()
-                .map(|item| item.extract::<u8>().unwrap())
-                .collect();
-            Ok(PyBinary { data })
-        } else {
-            Err(PyException::new_err(
-                "Expected `str` (of valid hex), `bytes`, or `[int]`",
-            ))
-        }
+        value.extract()
+    }
+}
+
+/// Decode a hex string into bytes.
+///
+/// The string is decoded directly from the UTF-8 buffer borrowed from the
+/// Python `str`, avoiding an intermediate owned `String`.
+pub fn decode_hex(hex: &str) -> PyResult<Vec<u8>> {
+    let mut data = vec![0u8; hex.len() / 2];
+    faster_hex::hex_decode(hex.as_bytes(), &mut data)
+        .map_err(|err| PyValueError::new_err(format!("Invalid hex string: {}", err)))?;
+    Ok(data)
+}
+
+/// Decode a hex string of exactly `N` bytes into a stack-allocated array.
+pub fn decode_hex_array<const N: usize>(hex: &str) -> PyResult<[u8; N]> {
+    if hex.len() != N * 2 {
+        return Err(PyValueError::new_err(format!(
+            "Invalid hex string length: expected {} characters, got {}",
+            N * 2,
+            hex.len()
+        )));
     }
+    let mut data = [0u8; N];
+    faster_hex::hex_decode(hex.as_bytes(), &mut data)
+        .map_err(|err| PyValueError::new_err(format!("Invalid hex string: {}", err)))?;
+    Ok(data)
 }
 
 impl From<PyBinary> for Vec<u8> {
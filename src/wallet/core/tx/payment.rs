@@ -13,7 +13,7 @@ use crate::address::PyAddress;
 /// Represents a single output in a transaction, specifying where funds
 /// should be sent and how much. Used with Generator and create_transactions.
 #[gen_stub_pyclass]
-#[pyclass(name = "PaymentOutput")]
+#[pyclass(name = "PaymentOutput", frozen)]
 #[derive(Clone)]
 pub struct PyPaymentOutput(PaymentOutput);
 
@@ -125,31 +125,36 @@ impl PyUtxoContext {
 
     /// Number of mature UTXO entries.
     #[getter]
-    fn get_mature_length(&self) -> usize {
-        self.0.mature_utxo_size()
+    fn get_mature_length(&self, py: Python<'_>) -> usize {
+        py.detach(|| self.0.mature_utxo_size())
     }
 
     /// Return a range of mature UTXO entries.
-    fn mature_range(&self, mut from_: usize, mut to: usize) -> PyResult<Vec<PyUtxoEntryReference>> {
-        let total = self.0.mature_utxo_size();
+    fn mature_range(
+        &self,
+        py: Python<'_>,
+        from_: usize,
+        to: usize,
+    ) -> PyResult<Vec<PyUtxoEntryReference>> {
         if from_ > to {
             return Err(PyException::new_err("'from_' must be <= 'to'"));
         }
-        if from_ > total {
-            from_ = total;
-        }
-        if to > total {
-            to = total;
-        }
-        if from_ == to {
-            return Ok(vec![]);
-        }
-        let entries = futures::executor::block_on(
-            UtxoStream::new(&self.0)
-                .skip(from_)
-                .take(to - from_)
-                .collect::<Vec<_>>(),
-        );
+        // Collect the entries without holding the GIL so the processor can keep
+        // applying UTXO updates; Python objects are built after re-acquiring it
+        let entries = py.detach(|| {
+            let total = self.0.mature_utxo_size();
+            let from_ = from_.min(total);
+            let to = to.min(total);
+            if from_ == to {
+                return vec![];
+            }
+            futures::executor::block_on(
+                UtxoStream::new(&self.0)
+                    .skip(from_)
+                    .take(to - from_)
+                    .collect::<Vec<_>>(),
+            )
+        });
         Ok(entries
             .into_iter()
             .map(PyUtxoEntryReference::from)
@@ -158,22 +163,49 @@ impl PyUtxoContext {
 
     /// Current balance for this context (if available).
     #[getter]
-    fn get_balance(&self) -> Option<PyBalance> {
-        self.0.balance().map(PyBalance::from)
+    fn get_balance(&self, py: Python<'_>) -> Option<PyBalance> {
+        py.detach(|| self.0.balance()).map(PyBalance::from)
     }
 
     /// Current balance formatted as strings (if available).
     #[getter]
-    fn get_balance_strings(&self) -> PyResult<Option<PyBalanceStrings>> {
-        let network_id = self.0.processor().network_id().ok();
-        let balance = self.0.balance();
-        if let (Some(network_id), Some(balance)) = (network_id, balance) {
-            let balance_strings: BalanceStrings =
-                balance.to_balance_strings(&network_id.network_type, None);
-            Ok(Some(balance_strings.into()))
-        } else {
-            Ok(None)
-        }
+    fn get_balance_strings(&self, py: Python<'_>) -> PyResult<Option<PyBalanceStrings>> {
+        Ok(py.detach(|| balance_strings(&self.0)))
+    }
+
+    /// Number of mature UTXO entries (async).
+    ///
+    /// Async counterpart of `mature_length`. The same synchronous read runs inside the
+    /// returned future on the async runtime, not on a separate blocking thread.
+    #[pyo3(name = "get_mature_length")]
+    fn get_mature_length_async<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let context = self.0.clone();
+        pyo3_async_runtimes::tokio::future_into_py(
+            py,
+            async move { Ok(context.mature_utxo_size()) },
+        )
+    }
+
+    /// Current balance for this context, if available (async).
+    ///
+    /// Async counterpart of `balance`. The same synchronous read runs inside the
+    /// returned future on the async runtime, not on a separate blocking thread.
+    #[pyo3(name = "get_balance")]
+    fn get_balance_async<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let context = self.0.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            Ok(context.balance().map(PyBalance::from))
+        })
+    }
+
+    /// Current balance formatted as strings, if available (async).
+    ///
+    /// Async counterpart of `balance_strings`. The same synchronous read runs inside the
+    /// returned future on the async runtime, not on a separate blocking thread.
+    #[pyo3(name = "get_balance_strings")]
+    fn get_balance_strings_async<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        let context = self.0.clone();
+        pyo3_async_runtimes::tokio::future_into_py(py, async move { Ok(balance_strings(&context)) })
     }
 }
 
@@ -183,6 +215,14 @@ impl From<PyUtxoContext> for UtxoContext {
     }
 }
 
+fn balance_strings(context: &UtxoContext) -> Option<PyBalanceStrings> {
+    let network_id = context.processor().network_id().ok()?;
+    let balance = context.balance()?;
+    let balance_strings: BalanceStrings =
+        balance.to_balance_strings(&network_id.network_type, None);
+    Some(balance_strings.into())
+}
+
 fn parse_addresses(value: Bound<'_, PyAny>) -> PyResult<Vec<Address>> {
     value
         .try_iter()
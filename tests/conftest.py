@@ -12,6 +12,8 @@ from kaspa import (
     Keypair,
     XPrv,
     Address,
+    Hash,
+    NetworkId,
     RpcClient,
     Resolver,
 )
@@ -92,6 +94,26 @@ def known_mainnet_address() -> Address:
     return Address(TEST_MAINNET_ADDRESS)
 
 
+# =============================================================================
+# Hash Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def zero_hash() -> Hash:
+    """Return the shared all-zero Hash."""
+    return Hash.zero()
+
+
+# =============================================================================
+# Network Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def testnet_network_id() -> NetworkId:
+    """Session-scoped testnet-10 NetworkId, parsed once and shared across tests."""
+    return NetworkId("testnet-10")
+
+
 # =============================================================================
 # Integration Test Fixtures (Network Required)
 # =============================================================================
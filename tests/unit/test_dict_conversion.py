@@ -26,9 +26,7 @@ class TestTransactionOutpointDict:
 
         d = outpoint.to_dict()
         assert isinstance(d, dict)
-        assert "transactionId" in d
-        assert "index" in d
-        assert d["index"] == 5
+        assert d == {"transactionId": "a" * 64, "index": 5}
 
     def test_outpoint_from_dict_roundtrip(self):
         """Test TransactionOutpoint to_dict/from_dict round-trip."""
@@ -40,6 +38,18 @@ class TestTransactionOutpointDict:
 
         assert original == restored
 
+    def test_outpoint_from_dict_missing_key(self):
+        """Test TransactionOutpoint from_dict raises KeyError for missing keys."""
+        with pytest.raises(KeyError):
+            TransactionOutpoint.from_dict({"index": 5})
+        with pytest.raises(KeyError):
+            TransactionOutpoint.from_dict({"transactionId": "a" * 64})
+
+    def test_outpoint_from_dict_invalid_transaction_id(self):
+        """Test TransactionOutpoint from_dict raises ValueError for an invalid transactionId."""
+        with pytest.raises(ValueError):
+            TransactionOutpoint.from_dict({"transactionId": "zz" * 32, "index": 5})
+
 
 class TestTransactionOutputDict:
     """Tests for TransactionOutput to_dict/from_dict methods."""
@@ -65,6 +75,13 @@ class TestTransactionOutputDict:
 
         assert original == restored
 
+    def test_output_from_dict_missing_key(self):
+        """Test TransactionOutput from_dict raises KeyError for missing keys."""
+        with pytest.raises(KeyError):
+            TransactionOutput.from_dict({"scriptPublicKey": {"version": 0, "script": "51"}})
+        with pytest.raises(KeyError):
+            TransactionOutput.from_dict({"value": 1000000, "scriptPublicKey": {"version": 0}})
+
 
 class TestTransactionInputDict:
     """Tests for TransactionInput to_dict/from_dict methods."""
@@ -94,13 +111,57 @@ class TestTransactionInputDict:
 
         assert original == restored
 
+    def test_input_from_dict_invalid_signature_script(self):
+        """Test TransactionInput from_dict rejects invalid signatureScript hex."""
+        d = TransactionInput(TransactionOutpoint(Hash("a" * 64), 5), "deadbeef", 0, 1).to_dict()
+
+        with pytest.raises(ValueError):
+            TransactionInput.from_dict({**d, "signatureScript": "zz"})
+
+    def test_input_json_roundtrip(self):
+        """Test TransactionInput to_json/from_json round-trip."""
+        tx_hash = Hash("a" * 64)
+        outpoint = TransactionOutpoint(tx_hash, 5)
+        original = TransactionInput(outpoint, "deadbeef", 0xFFFFFFFF, 1)
+
+        s = original.to_json()
+        assert isinstance(s, str)
+
+        restored = TransactionInput.from_json(s)
+        assert original == restored
+
+    def test_input_from_json_invalid(self):
+        """Test TransactionInput from_json raises ValueError for invalid JSON."""
+        with pytest.raises(ValueError):
+            TransactionInput.from_json("not json")
+
+    def test_input_dict_many_roundtrip(self):
+        """Test TransactionInput to_dict_many/from_dict_many round-trip."""
+        originals = [
+            TransactionInput(TransactionOutpoint(Hash("a" * 64), i), "deadbeef", 0xFFFFFFFF, 1)
+            for i in range(3)
+        ]
+
+        dicts = TransactionInput.to_dict_many(originals)
+        assert dicts == [original.to_dict() for original in originals]
+
+        restored = TransactionInput.from_dict_many(dicts)
+        assert restored == originals
+
+    def test_input_from_dict_many_missing_key(self):
+        """Test TransactionInput from_dict_many raises KeyError on an invalid item."""
+        valid = TransactionInput(TransactionOutpoint(Hash("a" * 64), 0), "deadbeef", 0, 1).to_dict()
+
+        with pytest.raises(KeyError):
+            TransactionInput.from_dict_many([valid, {"sequence": 0}])
+
 
 class TestTransactionDict:
     """Tests for Transaction to_dict/from_dict methods."""
 
-    def test_transaction_to_dict(self):
+    def test_transaction_to_dict(self, zero_hash):
         """Test Transaction to_dict method."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -121,9 +182,9 @@ class TestTransactionDict:
         assert "payload" in d
         assert "mass" in d
 
-    def test_transaction_from_dict_roundtrip(self):
+    def test_transaction_from_dict_roundtrip(self, zero_hash):
         """Test Transaction to_dict/from_dict round-trip."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -137,6 +198,75 @@ class TestTransactionDict:
 
         assert original == restored
 
+    def test_transaction_to_tuple(self, zero_hash):
+        """Test Transaction to_tuple matches to_dict values in key order."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        tx = Transaction(0, [input], [output], 100, "0" * 40, 0, "ab", 0)
+
+        t = tx.to_tuple()
+        assert isinstance(t, tuple)
+        assert t == tuple(tx.to_dict().values())
+
+    def test_transaction_from_dict_invalid_hex(self, zero_hash):
+        """Test Transaction from_dict raises ValueError for invalid id, subnetworkId and payload hex."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        d = Transaction(0, [input], [output], 100, "0" * 40, 0, "", 0).to_dict()
+
+        with pytest.raises(ValueError):
+            Transaction.from_dict({**d, "subnetworkId": "0" * 38})
+        with pytest.raises(ValueError):
+            Transaction.from_dict({**d, "subnetworkId": "zz" * 20})
+        with pytest.raises(ValueError):
+            Transaction.from_dict({**d, "payload": "zz"})
+        with pytest.raises(ValueError):
+            Transaction.from_dict({**d, "id": "zz" * 32})
+
+    def test_transaction_json_roundtrip(self, zero_hash):
+        """Test Transaction to_json/from_json and bytes variants round-trip."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        original = Transaction(0, [input], [output], 100, "0" * 40, 0, "", 0)
+
+        s = original.to_json()
+        assert isinstance(s, str)
+        assert Transaction.from_json(s) == original
+
+        b = original.to_json_bytes()
+        assert isinstance(b, bytes)
+        assert b == s.encode()
+        assert Transaction.from_json_bytes(b) == original
+
+    def test_transaction_from_json_bytes_invalid(self):
+        """Test Transaction from_json_bytes raises ValueError for invalid JSON."""
+        with pytest.raises(ValueError):
+            Transaction.from_json_bytes(b"not json")
+
+    def test_transaction_dict_many_roundtrip(self, zero_hash):
+        """Test Transaction to_dict_many/from_dict_many round-trip."""
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        inputs = [TransactionInput(TransactionOutpoint(zero_hash, i), "", 0, 1) for i in range(3)]
+        originals = [Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0) for input in inputs]
+
+        dicts = Transaction.to_dict_many(originals)
+        assert dicts == [original.to_dict() for original in originals]
+
+        restored = Transaction.from_dict_many(dicts)
+        assert restored == originals
+
+    def test_transaction_from_dict_many_missing_key(self, zero_hash):
+        """Test Transaction from_dict_many raises KeyError on an invalid item."""
+        input = TransactionInput(TransactionOutpoint(zero_hash, 0), "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        valid = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0).to_dict()
+
+        with pytest.raises(KeyError):
+            Transaction.from_dict_many([valid, {"version": 0}])
+
 
 class TestUtxoEntryDict:
     """Tests for UtxoEntry to_dict/from_dict methods."""
@@ -206,6 +336,8 @@ class TestUtxoEntryReferenceDict:
         assert "isCoinbase" in d
         # Should NOT have nested utxoEntry
         assert "utxoEntry" not in d
+        # Same dict as the referenced UtxoEntry
+        assert d == entry_ref.entry.to_dict()
 
     def test_utxo_entry_reference_from_dict_flat_format(self):
         """Test UtxoEntryReference from_dict with flat format."""
@@ -251,3 +383,80 @@ class TestUtxoEntryReferenceDict:
         restored = UtxoEntryReference.from_dict(d)
 
         assert original == restored
+
+    def test_utxo_entry_reference_dict_many_roundtrip(self):
+        """Test UtxoEntryReference to_dict_many/from_dict_many with mixed formats."""
+        flat = {
+            "address": "kaspa:qr0lr4ml9fn3chekrqmjdkergxl93l4wrk3dankcgvjq776s9wn9jkdskewva",
+            "outpoint": {"transactionId": "a" * 64, "index": 0},
+            "amount": 1000000,
+            "scriptPublicKey": {"version": 0, "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac"},
+            "blockDaaScore": 12345,
+            "isCoinbase": False,
+        }
+        nested = {
+            "address": "kaspa:qr0lr4ml9fn3chekrqmjdkergxl93l4wrk3dankcgvjq776s9wn9jkdskewva",
+            "outpoint": {"transactionId": "a" * 64, "index": 1},
+            "utxoEntry": {
+                "amount": 2000000,
+                "scriptPublicKey": {"version": 0, "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac"},
+                "blockDaaScore": 12345,
+                "isCoinbase": False,
+            },
+        }
+        originals = UtxoEntryReference.from_dict_many([flat, nested])
+        assert [entry.amount for entry in originals] == [1000000, 2000000]
+
+        dicts = UtxoEntryReference.to_dict_many(originals)
+        assert dicts == [original.to_dict() for original in originals]
+        assert UtxoEntryReference.from_dict_many(dicts) == originals
+
+
+class TestVerifyRoundtrip:
+    """Tests for verify_roundtrip classmethods."""
+
+    def test_outpoint_verify_roundtrip(self):
+        """Test TransactionOutpoint verify_roundtrip."""
+        d = TransactionOutpoint(Hash("a" * 64), 5).to_dict()
+        assert TransactionOutpoint.verify_roundtrip(d) is True
+
+    def test_transaction_verify_roundtrip(self, zero_hash):
+        """Test Transaction verify_roundtrip."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        d = Transaction(0, [input], [output], 100, "0" * 40, 0, "", 0).to_dict()
+
+        assert Transaction.verify_roundtrip(d) is True
+
+    def test_utxo_entry_reference_verify_roundtrip_nested_format(self):
+        """Test UtxoEntryReference verify_roundtrip with nested format."""
+        entry_dict = {
+            "address": "kaspa:qr0lr4ml9fn3chekrqmjdkergxl93l4wrk3dankcgvjq776s9wn9jkdskewva",
+            "outpoint": {"transactionId": "a" * 64, "index": 0},
+            "utxoEntry": {
+                "amount": 2000000,
+                "scriptPublicKey": {"version": 0, "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac"},
+                "blockDaaScore": 12345,
+                "isCoinbase": False,
+            },
+        }
+        assert UtxoEntryReference.verify_roundtrip(entry_dict) is True
+
+    def test_utxo_entry_reference_verify_roundtrip_all_fields(self):
+        """Test UtxoEntryReference verify_roundtrip preserves every entry field."""
+        entry_dict = {
+            "address": "kaspa:qr0lr4ml9fn3chekrqmjdkergxl93l4wrk3dankcgvjq776s9wn9jkdskewva",
+            "outpoint": {"transactionId": "a" * 64, "index": 3},
+            "amount": 2000000,
+            "scriptPublicKey": {"version": 0, "script": "20852be1b87fca94453a35027c550a3ccdbebb5913106029f3a8bf18152bf93bffac"},
+            "blockDaaScore": 12345,
+            "isCoinbase": True,
+        }
+        assert UtxoEntryReference.verify_roundtrip(entry_dict) is True
+        assert UtxoEntryReference.from_dict(entry_dict).to_dict() == entry_dict
+
+    def test_verify_roundtrip_missing_key(self):
+        """Test verify_roundtrip raises KeyError for missing keys."""
+        with pytest.raises(KeyError):
+            TransactionInput.verify_roundtrip({"sequence": 0})
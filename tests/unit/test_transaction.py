@@ -33,9 +33,9 @@ from kaspa import (
 class TestTransactionOutpoint:
     """Tests for TransactionOutpoint class."""
 
-    def test_create_outpoint(self):
+    def test_create_outpoint(self, zero_hash):
         """Test creating a TransactionOutpoint."""
-        tx_hash = Hash("0" * 64)  # 32-byte zero hash
+        tx_hash = zero_hash  # 32-byte zero hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         assert isinstance(outpoint, TransactionOutpoint)
 
@@ -57,6 +57,25 @@ class TestTransactionOutpoint:
         outpoint_id = outpoint.get_id()
         assert isinstance(outpoint_id, str)
 
+    def test_outpoint_from_str_and_bytes(self):
+        """Test TransactionOutpoint accepts a hex str or bytes transaction ID."""
+        tx_id = "c" * 64
+        from_hash = TransactionOutpoint(Hash(tx_id), 1)
+
+        assert TransactionOutpoint(tx_id, 1) == from_hash
+        assert TransactionOutpoint(bytes.fromhex(tx_id), 1) == from_hash
+        assert TransactionOutpoint(tx_id, 2) != from_hash
+        assert TransactionOutpoint("d" * 64, 1) != from_hash
+
+    def test_outpoint_invalid_transaction_id(self):
+        """Test TransactionOutpoint rejects invalid transaction IDs."""
+        with pytest.raises(ValueError):
+            TransactionOutpoint("zz" * 32, 0)
+        with pytest.raises(ValueError):
+            TransactionOutpoint(b"\x00" * 31, 0)
+        with pytest.raises(Exception):
+            TransactionOutpoint(123, 0)
+
 
 class TestScriptPublicKey:
     """Tests for ScriptPublicKey class."""
@@ -79,6 +98,19 @@ class TestScriptPublicKey:
         spk = ScriptPublicKey(0, script_list)
         assert isinstance(spk, ScriptPublicKey)
 
+    def test_create_script_public_key_from_bytes_list_and_hex(self):
+        """Test ScriptPublicKey accepts equivalent bytes, list[int], and hex inputs."""
+        from_bytes = ScriptPublicKey(0, bytes([0x51]))
+
+        assert ScriptPublicKey(0, [0x51]) == from_bytes
+        assert ScriptPublicKey(0, "51") == from_bytes
+        assert from_bytes.script == "51"
+
+    def test_create_script_public_key_invalid_list(self):
+        """Test ScriptPublicKey rejects lists containing non-byte values."""
+        with pytest.raises(Exception):
+            ScriptPublicKey(0, [0x51, 256])
+
     def test_script_public_key_script_property(self):
         """Test ScriptPublicKey script property."""
         script_hex = "51"
@@ -87,6 +119,16 @@ class TestScriptPublicKey:
         script = spk.script
         assert isinstance(script, str)
 
+    def test_script_public_key_script_and_str(self):
+        """Test ScriptPublicKey script and str return the script hex."""
+        script_hex = "20" + "ab" * 32 + "ac"
+        spk = ScriptPublicKey(0, script_hex)
+        other = ScriptPublicKey(0, script_hex)
+
+        assert spk.script == script_hex
+        assert str(spk) == script_hex
+        assert spk == other
+
 
 class TestTransactionOutput:
     """Tests for TransactionOutput class."""
@@ -116,9 +158,9 @@ class TestTransactionOutput:
 class TestTransactionInput:
     """Tests for TransactionInput class."""
 
-    def test_create_transaction_input(self):
+    def test_create_transaction_input(self, zero_hash):
         """Test creating a TransactionInput."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
         assert isinstance(input, TransactionInput)
@@ -137,9 +179,9 @@ class TestTransactionInput:
 class TestTransaction:
     """Tests for Transaction class."""
 
-    def test_create_minimal_transaction(self):
+    def test_create_minimal_transaction(self, zero_hash):
         """Test creating a minimal transaction."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -149,9 +191,9 @@ class TestTransaction:
         tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
         assert isinstance(tx, Transaction)
 
-    def test_transaction_equality(self):
+    def test_transaction_equality(self, zero_hash):
         """Test transaction equality works."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -162,9 +204,12 @@ class TestTransaction:
         tx2 = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
         assert tx1 == tx2
 
-    def test_transaction_properties(self):
+        tx3 = Transaction(0, [input], [output], 1, "0" * 40, 0, "", 0)
+        assert tx1 != tx3
+
+    def test_transaction_properties(self, zero_hash):
         """Test Transaction properties."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -178,9 +223,9 @@ class TestTransaction:
         assert len(tx.inputs) == 1
         assert len(tx.outputs) == 1
 
-    def test_transaction_id(self):
+    def test_transaction_id(self, zero_hash):
         """Test Transaction id property."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -193,9 +238,29 @@ class TestTransaction:
         assert isinstance(tx_id, str)
         assert len(tx_id) == 64  # 32 bytes hex
 
-    def test_transaction_is_coinbase(self):
+    def test_transaction_id_stored_until_finalize(self, zero_hash):
+        """Test Transaction id is stored and only refreshed by finalize."""
+        tx_hash = zero_hash
+        outpoint = TransactionOutpoint(tx_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+
+        spk = ScriptPublicKey(0, "51")
+        output = TransactionOutput(1000000, spk)
+
+        tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+        tx_id = tx.id
+        assert tx.id == tx_id
+
+        tx.gas = 1
+        assert tx.id == tx_id
+
+        new_id = tx.finalize()
+        assert new_id.to_string() == tx.id
+        assert tx.id != tx_id
+
+    def test_transaction_is_coinbase(self, zero_hash):
         """Test Transaction is_coinbase method."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = zero_hash
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
 
@@ -208,6 +273,59 @@ class TestTransaction:
         # (coinbase transactions have specific subnetwork_id)
         assert isinstance(tx.is_coinbase(), bool)
 
+    def test_transaction_constructor_subnetwork_id(self, zero_hash):
+        """Test the constructor accepts well-known subnetwork IDs as str or bytes."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+
+        coinbase = Transaction(0, [input], [output], 0, "01" + "0" * 38, 0, "", 0)
+        assert coinbase.is_coinbase()
+        assert coinbase.subnetwork == "01" + "0" * 38
+
+        registry = Transaction(0, [input], [output], 0, "02" + "0" * 38, 0, "", 0)
+        assert not registry.is_coinbase()
+        assert registry.subnetwork == "02" + "0" * 38
+
+        from_bytes = Transaction(0, [input], [output], 0, bytes([1]) + bytes(19), 0, "", 0)
+        assert from_bytes.is_coinbase()
+
+        with pytest.raises(Exception):
+            Transaction(0, [input], [output], 0, "0" * 38, 0, "", 0)
+
+    def test_transaction_subnetwork_id_setter(self, zero_hash):
+        """Test setting well-known and arbitrary subnetwork IDs."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+
+        tx.subnetwork_id = "01" + "0" * 38
+        assert tx.is_coinbase()
+
+        tx.subnetwork_id = "ab" * 20
+        assert tx.subnetwork == "ab" * 20
+        assert not tx.is_coinbase()
+
+        with pytest.raises(ValueError):
+            tx.subnetwork_id = "zz"
+
+
+class TestInstanceLayout:
+    """Tests that Rust-backed classes keep a fixed, slot-like instance layout."""
+
+    def test_no_instance_dict(self, zero_hash):
+        """Test instances have no __dict__ and reject unknown attributes."""
+        outpoint = TransactionOutpoint(zero_hash, 0)
+        input = TransactionInput(outpoint, "", 0, 1)
+        output = TransactionOutput(1000000, ScriptPublicKey(0, "51"))
+        tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+
+        for obj in (zero_hash, outpoint, input, output, output.script_public_key, tx):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.extra = 1
+
 
 class TestPaymentOutput:
     """Tests for PaymentOutput class."""
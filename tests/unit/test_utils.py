@@ -15,6 +15,8 @@ from kaspa import (
     PublicKey,
     Hash,
     AccountKind,
+    NetworkId,
+    NetworkType,
     create_multisig_address,
 )
 
@@ -196,6 +198,13 @@ class TestHash:
         result = hash_obj.to_string()
         assert isinstance(result, str)
 
+    def test_hash_zero(self):
+        """Test Hash.zero returns a shared all-zero Hash."""
+        zero = Hash.zero()
+        assert zero == Hash("0" * 64)
+        assert bytes(zero) == bytes(32)
+        assert Hash.zero() is zero
+
 
 class TestAccountKind:
     """Tests for AccountKind class."""
@@ -219,6 +228,25 @@ class TestAccountKind:
         assert isinstance(result, str)
 
 
+class TestNetworkId:
+    """Tests for NetworkId class."""
+
+    @pytest.mark.parametrize("name", ["mainnet", "testnet-10", "testnet-11", "devnet", "simnet", "testnet-12"])
+    def test_network_id_from_str(self, name):
+        """Test NetworkId round-trips well-known and other network names."""
+        assert str(NetworkId(name)) == name
+
+    def test_network_id_testnet_suffix(self, testnet_network_id):
+        """Test the parsed testnet-10 NetworkId matches one built from parts."""
+        assert testnet_network_id == NetworkId.with_suffix(NetworkType.Testnet, 10)
+        assert testnet_network_id.suffix == 10
+
+    def test_network_id_invalid(self):
+        """Test NetworkId rejects unknown network names."""
+        with pytest.raises(Exception):
+            NetworkId("notanetwork")
+
+
 class TestMultisigAddress:
     """Tests for multisig address creation."""
 
@@ -1,9 +1,9 @@
-from kaspa import NetworkId, UtxoProcessor
+from kaspa import UtxoProcessor
 
 
-def test_set_coinbase_transaction_maturity_daa_smoke():
-    UtxoProcessor.set_coinbase_transaction_maturity_daa(NetworkId("testnet-10"), 1000)
+def test_set_coinbase_transaction_maturity_daa_smoke(testnet_network_id):
+    UtxoProcessor.set_coinbase_transaction_maturity_daa(testnet_network_id, 1000)
 
 
-def test_set_user_transaction_maturity_daa_smoke():
-    UtxoProcessor.set_user_transaction_maturity_daa(NetworkId("testnet-10"), 100)
+def test_set_user_transaction_maturity_daa_smoke(testnet_network_id):
+    UtxoProcessor.set_user_transaction_maturity_daa(testnet_network_id, 100)